@@ -0,0 +1 @@
+"""浩子比赛排名系统源码包"""
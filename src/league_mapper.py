@@ -4,6 +4,8 @@
 全局可用，无需实例化
 """
 
+from types import MappingProxyType
+
 # 联赛名称映射字典
 LEAGUE_MAP = {"英超": "E0", "西甲": "SP1", "德甲": "D1", "意甲": "I1", "法甲": "F1"}
 
@@ -21,6 +23,10 @@ def get_league_code(chinese_name):
     return LEAGUE_MAP.get(chinese_name)
 
 
+# LEAGUE_MAP的只读视图，由get_all_leagues返回，避免每次调用都复制字典
+_LEAGUE_MAP_VIEW = MappingProxyType(LEAGUE_MAP)
+
+
 def add_league_mapping(chinese_name, league_code):
     """
     添加新的联赛映射关系
@@ -37,9 +43,10 @@ def get_all_leagues():
     获取所有已映射的联赛名称和代码
 
     Returns:
-        dict: 包含所有联赛映射关系的字典
+        MappingProxyType: 包含所有联赛映射关系的只读视图，
+            会反映add_league_mapping添加的映射，需要修改时请自行复制
     """
-    return LEAGUE_MAP.copy()
+    return _LEAGUE_MAP_VIEW
 
 
 def is_valid_league(chinese_name):
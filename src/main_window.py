@@ -1,6 +1,8 @@
 import sys
 import logging
 from datetime import datetime
+from operator import itemgetter
+import numpy as np
 from typing import Optional
 from PyQt6.QtWidgets import (
     QApplication,
@@ -18,7 +20,7 @@ from PyQt6.QtWidgets import (
     QMessageBox,
 )
 from .team_info_dialog import TeamInfoDialog
-from .sqlite_importer import sqlite_importer
+from .sqlite_importer import get_sqlite_importer
 from PyQt6.QtCore import Qt
 from .match_ranking import MatchRankingSystem
 from .team_name_mapper import TeamNameMapper
@@ -67,6 +69,18 @@ class RankingSystemMainWindow(QMainWindow):
                 matches = self.match_data_manager.get_matches({"Div": league_code})
                 print(f"成功获取 {len(matches)} 场比赛数据")
 
+                # 先批量创建比赛中出现的所有队伍并设置联赛信息，
+                # 创建顺序与逐场创建时相同（每场先主队后客队）
+                self.team_manager.create_teams_bulk(
+                    (team_name, league_code)
+                    for match in matches
+                    if "HomeTeam" in match
+                    and "AwayTeam" in match
+                    and "FTHG" in match
+                    and "FTAG" in match
+                    for team_name in (match["HomeTeam"], match["AwayTeam"])
+                )
+
                 # 处理比赛数据
                 for match in matches:
                     if (
@@ -80,16 +94,13 @@ class RankingSystemMainWindow(QMainWindow):
                         home_score = int(match["FTHG"])
                         away_score = int(match["FTAG"])
 
-                        # 使用已经确定的联赛代码
-                        league_code = get_league_code(league_name)
-
-                        # 首先通过TeamManager创建或获取队伍，并设置联赛信息
-                        self.team_manager.create_team(home, league=league_code)
-                        self.team_manager.create_team(away, league=league_code)
+                        # 队伍已在循环前批量创建，每场比赛只查询一次Team对象
+                        home_team = self.team_manager.get_team(home)
+                        away_team = self.team_manager.get_team(away)
 
                         # 更新队伍的比赛次数
-                        self.team_manager.increment_match_count(home)
-                        self.team_manager.increment_match_count(away)
+                        home_team.increment_match_count()
+                        away_team.increment_match_count()
 
                         # 使用两种算法处理同一场比赛
                         self.ranking_system.elo_algorithm.process_match(
@@ -100,11 +111,6 @@ class RankingSystemMainWindow(QMainWindow):
                         )
 
                         # 获取当前比赛的mu、elo和sigma值
-                        # 对于HomeTeam
-                        home_team = self.team_manager.get_team(home)
-                        # 对于AwayTeam
-                        away_team = self.team_manager.get_team(away)
-
                         # 获取比赛ID和日期
                         match_id = int(match.get("id", 0))
                         match_date_value = match.get("Date", "")
@@ -256,13 +262,16 @@ class RankingSystemMainWindow(QMainWindow):
             # 如果仍然找不到，尝试在所有队伍中进行模糊匹配
             if not team:
                 print(f"调试信息: 尝试在所有队伍中进行模糊匹配")
-                all_teams = self.team_manager.get_all_teams()
-                # 转换为小写进行模糊匹配
+                # 转换为小写进行模糊匹配，找到后即停止
+                # 队名写法与映射表不同（如"Nottm Forest"）时，显示的中文名来自规范化查找，
+                # 反向映射得到的英文名与系统队名不一致，这里按中文名再比对一次
                 display_lower = display_name.lower()
-                for t in all_teams:
+                get_chinese_name = self.team_mapper.get_chinese_name
+                for t in self.team_manager.iter_teams():
                     if (
                         display_lower in t.name.lower()
                         or t.name.lower() in display_lower
+                        or get_chinese_name(t.name) == display_name
                     ):
                         team = t
                         print(f"调试信息: 模糊匹配成功 - 找到了 '{t.name}'")
@@ -466,20 +475,18 @@ class RankingSystemMainWindow(QMainWindow):
             # 使用TeamManager获取当前联赛的所有队伍
             league_teams = self.team_manager.get_teams_by_league(self.current_league)
 
-            # 获取所有队伍的Elo排名并构建字典
-            all_elo_rankings = dict(self.ranking_system.get_elo_rankings())
+            # 按队名查询Elo算法中的评分
+            all_elo_rankings = self.ranking_system.elo_algorithm.teams
 
-            # 构建排名数据
-            processed_rankings = []
-            for team in league_teams:
-                # 从排名字典中获取队伍的Elo评分，如果不存在则使用队伍默认值
-                elo_rating = all_elo_rankings.get(team.name, team.elo)
-                processed_rankings.append(
-                    (team.name, elo_rating, 1.0, team.match_count)
-                )
+            # 构建排名数据，从排名字典中获取队伍的Elo评分，如果不存在则使用队伍默认值
+            get_elo_rating = all_elo_rankings.get
+            processed_rankings = [
+                (team.name, get_elo_rating(team.name, team.elo), 1.0, team.match_count)
+                for team in league_teams
+            ]
 
             # 按Elo评分降序排序
-            processed_rankings.sort(key=lambda x: x[1], reverse=True)
+            processed_rankings.sort(key=itemgetter(1), reverse=True)
             return processed_rankings
         except Exception as e:
             print(f"加载Elo排名出错: {e}")
@@ -495,38 +502,55 @@ class RankingSystemMainWindow(QMainWindow):
             league_teams = self.team_manager.get_teams_by_league(self.current_league)
             min_sigma = 1.5  # 最小sigma值用于稳定性计算
 
-            # 获取所有队伍的OpenSkill排名并构建字典
-            all_openskill_rankings = dict(self.ranking_system.get_openskill_rankings())
-
-            # 构建排名数据
-            processed_rankings = []
-            for team in league_teams:
-                # 从排名字典中获取队伍的OpenSkill评分，如果不存在则为None
-                openskill_rating = all_openskill_rankings.get(team.name)
-
-                if openskill_rating:
-                    # 如果ranking_system中有评分，使用该评分
-                    mu_value = openskill_rating[0].mu
-                    sigma_value = openskill_rating[0].sigma
-                else:
-                    # 否则使用队伍对象中的默认值
-                    mu_value = team.mu
-                    sigma_value = team.sigma
-
-                # 计算积分：mu值乘以25后取整
-                score = int(mu_value * 25)
-
-                # 计算稳定性：Stability = (1 / sigma) / (1 / min_sigma) × 100
-                stability_value = (1 / sigma_value) / (1 / min_sigma) * 100
-                # 四舍五入处理并添加%符号
-                stability = f"{round(stability_value)}%"
-
-                processed_rankings.append(
-                    (team.name, score, stability, team.match_count)
-                )
+            # 按队名查询OpenSkill算法中的评分
+            all_openskill_rankings = self.ranking_system.openskill_algorithm.teams
+
+            # 从排名字典中获取每支队伍的OpenSkill评分，如果不存在则为None
+            team_ratings = [
+                all_openskill_rankings.get(team.name) for team in league_teams
+            ]
+            team_count = len(league_teams)
+
+            # ranking_system中有评分时使用该评分，否则使用队伍对象中的默认值，
+            # 收集为数组后整体计算积分和稳定性
+            mu_values = np.fromiter(
+                (
+                    rating[0].mu if rating else team.mu
+                    for rating, team in zip(team_ratings, league_teams)
+                ),
+                dtype=np.float64,
+                count=team_count,
+            )
+            sigma_values = np.fromiter(
+                (
+                    rating[0].sigma if rating else team.sigma
+                    for rating, team in zip(team_ratings, league_teams)
+                ),
+                dtype=np.float64,
+                count=team_count,
+            )
 
-            # 按积分降序排序
-            processed_rankings.sort(key=lambda x: x[1], reverse=True)
+            # 计算积分：mu值乘以25后取整
+            scores = (mu_values * 25).astype(np.int64)
+
+            # 计算稳定性：Stability = (1 / sigma) / (1 / min_sigma) × 100
+            stability_values = (1 / sigma_values) / (1 / min_sigma) * 100
+
+            # 按积分降序排序，积分相同时保持原有顺序
+            order = np.argsort(-scores, kind="stable")
+
+            # 构建排名数据，稳定性四舍五入处理并添加%符号
+            score_list = scores.tolist()
+            stability_list = stability_values.tolist()
+            processed_rankings = [
+                (
+                    league_teams[i].name,
+                    score_list[i],
+                    f"{round(stability_list[i])}%",
+                    league_teams[i].match_count,
+                )
+                for i in order.tolist()
+            ]
             return processed_rankings
         except Exception as e:
             print(f"加载OpenSkill排名出错: {e}")
@@ -552,6 +576,8 @@ class RankingSystemMainWindow(QMainWindow):
             # 遍历所有选中的文件路径
             total_imported = 0
             total_skipped = 0
+            # 首次导入时才打开数据库连接
+            sqlite_importer = get_sqlite_importer()
 
             for file_path in file_paths:
                 try:
@@ -5,31 +5,123 @@
 
 import logging
 import os
-import sys
 import sqlite3
+import threading
+import weakref
+from collections import defaultdict
 from datetime import datetime
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from itertools import chain
 
-# 添加更全面的路径设置，确保能够找到必要的模块
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from .league_mapper import get_league_code
+from .sqlite_schema import INDEX_SCRIPT, PRAGMA_SCRIPT
 
-# 尝试导入league_mapper模块
-try:
-    from league_mapper import get_league_code
+logger = logging.getLogger(__name__)
 
-    league_mapper_available = True
-except ImportError:
-    print("警告: 无法导入league_mapper模块，将使用默认的联赛代码映射")
-    league_mapper_available = False
 
-    # 创建一个简单的league_mapper备用实现
-    def get_league_code(chinese_name):
-        """备用的get_league_code函数实现"""
-        default_map = {"英超": "E0", "西甲": "SP1"}
-        return default_map.get(chinese_name)
+@lru_cache(maxsize=128)
+def _insert_sql(columns):
+    """
+    构建指定字段组合的INSERT语句，相同字段组合只构建一次
 
+    Args:
+        columns (tuple): 排序后的字段名元组，顺序与参数值顺序一致
+
+    Returns:
+        str: INSERT语句
+    """
+    # 处理关键字字段AS
+    quoted = ", ".join(_QUOTE(col, col) for col in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    return f"INSERT INTO matches ({quoted}) VALUES ({placeholders})"
+
+
+# SQLite 3.35起支持INSERT ... RETURNING，可在插入的同时取回新记录的ID
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# 每条多行INSERT语句的最大行数
+_MAX_ROWS_PER_INSERT = 500
+
+
+@lru_cache(maxsize=128)
+def _insert_returning_sql(columns, row_count):
+    """
+    构建一次插入多行并返回新记录ID的INSERT语句
+
+    Args:
+        columns (tuple): 排序后的字段名元组，顺序与参数值顺序一致
+        row_count (int): 插入的行数
+
+    Returns:
+        str: INSERT ... VALUES (...), (...) RETURNING id语句
+    """
+    # 处理关键字字段AS
+    quoted = ", ".join(_QUOTE(col, col) for col in columns)
+    row_placeholders = "(" + ", ".join("?" for _ in columns) + ")"
+    values = ", ".join([row_placeholders] * row_count)
+    return f"INSERT INTO matches ({quoted}) VALUES {values} RETURNING id"
+
+
+@lru_cache(maxsize=128)
+def _update_sql(columns):
+    """
+    构建指定字段组合的UPDATE语句，相同字段组合只构建一次
+
+    Args:
+        columns (tuple): 排序后的待更新字段名元组，顺序与参数值顺序一致
+
+    Returns:
+        str: UPDATE语句，最后一个参数为记录ID
+    """
+    # 处理关键字字段AS
+    update_fields = ", ".join(f"{_QUOTE(col, col)} = ?" for col in columns)
+    return f"UPDATE matches SET {update_fields} WHERE id = ?"
+
+
+class _ConnectionOwner:
+    """线程局部存储中代表连接持有者的占位对象，被回收时关闭对应的连接"""
+
+    __slots__ = ("__weakref__",)
+
+
+class _SharedConnections:
+    """
+    同一数据库文件在进程内共享的连接集合
+    每个线程持有各自的连接和游标，线程结束时其连接随线程局部存储一起被关闭；
+    仍在使用的连接统一记录，以便close()关闭
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """丢弃线程局部存储和连接记录，返回之前记录的连接集合"""
+        connections = getattr(self, "connections", set())
+        self.local = threading.local()
+        self.connections = set()
+        return connections
+
+    def register(self, conn):
+        """
+        记录当前线程新建的连接，线程结束（或reset()丢弃线程局部存储）时自动关闭
+
+        Args:
+            conn (sqlite3.Connection): 当前线程的连接
+        """
+        owner = self.local.owner = _ConnectionOwner()
+        self.connections.add(conn)
+        weakref.finalize(owner, self._release, conn, self.connections)
+
+    @staticmethod
+    def _release(conn, connections):
+        """从连接记录中移除并关闭连接"""
+        connections.discard(conn)
+        conn.close()
 
-logger = logging.getLogger(__name__)
+
+# 需要加方括号转义的字段名（AS是SQL关键字），用法: _QUOTE(key, key)
+_QUOTE = {"AS": "[AS]"}.get
 
 
 class MatchDataManager:
@@ -38,39 +130,96 @@ class MatchDataManager:
     通过SQLite存储和检索比赛数据
     """
 
-    def __init__(self):
+    # 进程内按数据库路径共享的连接池，避免每个实例重复打开同一个数据库文件
+    _pool = {}
+    _pool_lock = threading.Lock()
+
+    def __init__(self, db_path=None):
         """
         初始化比赛数据管理器
         连接到SQLite数据库，用于存储和检索比赛数据
+
+        Args:
+            db_path (str, None): 数据库文件路径，默认为项目根目录下的match_data.db
         """
-        # 项目根目录下的match_data.db文件
-        self.db_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "match_data.db")
-        )
-        self.conn = None
-        self.cursor = None
+        if db_path is None:
+            db_path = os.path.join(os.path.dirname(__file__), "..", "match_data.db")
+        self.db_path = os.path.abspath(db_path)
+        self._shared = self._get_shared(self.db_path)
+        # matches表的列名，首次查询时从表结构读取
+        self._columns = []
+        self._valid_columns = frozenset()
         self._connect()
 
+    @classmethod
+    def _get_shared(cls, db_path):
+        """
+        获取指定数据库路径在连接池中的共享连接集合，不存在时创建
+
+        Args:
+            db_path (str): 数据库文件路径
+
+        Returns:
+            _SharedConnections: 共享连接集合
+        """
+        with cls._pool_lock:
+            shared = cls._pool.get(db_path)
+            if shared is None:
+                shared = cls._pool[db_path] = _SharedConnections()
+            return shared
+
+    @property
+    def conn(self):
+        """当前线程的SQLite连接，未连接时为None"""
+        return getattr(self._shared.local, "conn", None)
+
+    @conn.setter
+    def conn(self, value):
+        self._shared.local.conn = value
+
+    @property
+    def cursor(self):
+        """当前线程的SQLite游标，未连接时为None"""
+        return getattr(self._shared.local, "cursor", None)
+
+    @cursor.setter
+    def cursor(self, value):
+        self._shared.local.cursor = value
+
     def _connect(self):
         """
-        建立SQLite连接
+        为当前线程建立SQLite连接，同一线程内已有的池化连接会被直接复用
 
         Returns:
             bool: 连接是否成功
         """
+        self._shared = self._get_shared(self.db_path)
+        if self.conn is not None:
+            return True
+
         try:
             # 检查数据库文件是否存在
             db_exists = os.path.exists(self.db_path)
 
             # 建立SQLite连接
-            self.conn = sqlite3.connect(self.db_path)
+            # 增大语句缓存，使参数化查询可以复用已编译的语句
+            # 连接可能在其他线程中被close()统一关闭，因此关闭同线程检查
+            self.conn = sqlite3.connect(
+                self.db_path, cached_statements=256, check_same_thread=False
+            )
+            # 以sqlite3.Row返回结果行
+            self.conn.row_factory = sqlite3.Row
             self.cursor = self.conn.cursor()
+            with self._pool_lock:
+                self._shared.register(self.conn)
 
             if not db_exists:
                 logger.info(f"创建新的SQLite数据库: {self.db_path}")
             else:
                 logger.info(f"连接到现有SQLite数据库: {self.db_path}")
 
+            self._apply_pragmas()
+
             # 检查matches表是否存在，如果不存在，创建一个基础结构
             self._check_table_exists()
 
@@ -81,6 +230,16 @@ class MatchDataManager:
             self.cursor = None
             return False
 
+    def _apply_pragmas(self):
+        """
+        为当前连接设置日志模式、同步级别和缓存大小
+        设置失败（如只读文件系统）时保留默认设置继续使用连接
+        """
+        try:
+            self.cursor.executescript(PRAGMA_SCRIPT)
+        except Exception as e:
+            logger.warning(f"设置SQLite连接参数时出错: {e}")
+
     def _check_table_exists(self):
         """
         检查matches表是否存在，如果不存在则创建基础结构
@@ -94,18 +253,137 @@ class MatchDataManager:
 
             if not table_exists:
                 logger.warning("matches表不存在，生成的查询将返回空结果")
+                return
+
+            # 一次executescript创建全部查询索引
+            self.cursor.executescript(INDEX_SCRIPT)
         except Exception as e:
             logger.error(f"检查matches表时出错: {e}")
 
     def is_connected(self):
         """
-        检查是否已连接到SQLite
+        检查当前线程是否已连接到SQLite
 
         Returns:
             bool: 是否已连接
         """
         return self.conn is not None
 
+    def _ensure_conn(self):
+        """
+        确保当前线程已建立连接，未连接时才会打开新连接
+
+        Returns:
+            bool: 连接是否可用
+        """
+        return self.conn is not None or self._connect()
+
+    def _max_variables(self):
+        """
+        获取当前连接单条语句允许的参数数量上限
+        SQLite 3.32之前默认为999，之后为32766，编译时也可能被修改
+
+        Returns:
+            int: 参数数量上限
+        """
+        return self.conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+
+    def _transaction(self):
+        """
+        获取写操作使用的事务上下文
+        在bulk()中由外层统一提交，否则每次写操作单独提交，出错时回滚
+
+        Returns:
+            上下文管理器
+        """
+        if getattr(self._shared.local, "in_bulk", False):
+            return nullcontext()
+        return self.conn
+
+    @contextmanager
+    def bulk(self):
+        """
+        将多次写操作合并到同一个事务中，退出时统一提交，出错时整体回滚
+
+        用法:
+            with manager.bulk():
+                for match in matches:
+                    manager.save_match(match)
+        """
+        if not self._ensure_conn():
+            raise sqlite3.OperationalError("数据库连接不可用")
+
+        local = self._shared.local
+        if getattr(local, "in_bulk", False):
+            # 已在外层bulk事务中，直接复用
+            yield self
+            return
+
+        conn = self.conn
+        conn.execute("BEGIN")
+        local.in_bulk = True
+        try:
+            yield self
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            local.in_bulk = False
+
+    def _get_columns(self):
+        """
+        获取matches表的全部列名，读取成功后缓存在实例上
+
+        Returns:
+            list: 列名列表，表不存在时为空列表
+        """
+        if not self._columns:
+            self.cursor.execute("PRAGMA table_info(matches)")
+            self._columns = [row[1] for row in self.cursor.fetchall()]
+            self._valid_columns = frozenset(self._columns)
+        return self._columns
+
+    def _check_columns(self, columns):
+        """
+        检查字段名是否都是matches表中的列，字段名会被直接拼接进SQL语句
+        表结构未知（表不存在）时不做检查，由SQLite报告错误
+
+        Args:
+            columns (iterable): 待检查的字段名
+
+        Raises:
+            ValueError: 存在未知字段时抛出
+        """
+        self._get_columns()
+        valid_columns = self._valid_columns
+        if valid_columns and not valid_columns.issuperset(columns):
+            unknown = sorted(set(columns) - valid_columns)
+            raise ValueError(f"未知字段: {', '.join(unknown)}")
+
+    @staticmethod
+    def _normalize_date(match_dict):
+        """
+        确保比赛数据中的Date字段是时间戳格式
+
+        Args:
+            match_dict (dict): 比赛数据字典，会被原地修改
+
+        Returns:
+            dict: 传入的比赛数据字典
+        """
+        date = match_dict.get("Date")
+        # 如果已经是整数类型（时间戳格式）或为空，直接保留
+        if date is None or isinstance(date, int):
+            return match_dict
+        try:
+            # 如果是字符串，尝试转换为时间戳
+            match_dict["Date"] = int(date)
+        except (ValueError, TypeError):
+            # 如果无法转换，记录警告并保持原样
+            logger.warning(f"无法将日期值'{date}'转换为时间戳")
+        return match_dict
+
     def save_match(self, match_data):
         """
         保存一场比赛数据
@@ -116,38 +394,25 @@ class MatchDataManager:
         Returns:
             str: 保存的记录ID，如果失败返回None
         """
-        if not self.is_connected():
-            if not self._connect():
-                return None
+        if not self._ensure_conn():
+            return None
 
         try:
-            # 提取数据字段和值
-            keys = []
-            values = []
-            placeholders = []
-
-            for key, value in match_data.items():
-                # 处理关键字字段AS
-                col_name = "[AS]" if key == "AS" else key
-                keys.append(col_name)
-                values.append(value)
-                placeholders.append("?")
-
-            # 构建SQL语句
-            sql = f"INSERT INTO matches ({', '.join(keys)}) VALUES ({', '.join(placeholders)})"
+            # 按排序后的字段获取SQL语句，使字段顺序不同的字典共用同一条语句
+            columns = tuple(sorted(match_data))
+            self._check_columns(columns)
+            sql = _insert_sql(columns)
 
-            # 执行插入
-            self.cursor.execute(sql, values)
-            self.conn.commit()
+            # 执行插入，不在bulk()中时退出with块即提交，出错时自动回滚
+            with self._transaction():
+                self.cursor.execute(sql, [match_data[col] for col in columns])
 
             # 获取插入的ID
             inserted_id = self.cursor.lastrowid
-            logger.info(f"成功保存比赛数据，记录ID: {inserted_id}")
+            logger.info("成功保存比赛数据，记录ID: %s", inserted_id)
             return str(inserted_id)
         except Exception as e:
             logger.error(f"保存比赛数据时出错: {e}")
-            if self.conn:
-                self.conn.rollback()
             return None
 
     def save_matches(self, matches_data):
@@ -160,160 +425,251 @@ class MatchDataManager:
         Returns:
             list: 保存的记录ID列表，如果失败返回None
         """
-        if not self.is_connected():
-            if not self._connect():
-                return None
+        if not self._ensure_conn():
+            return None
 
         try:
-            inserted_ids = []
-
-            # 逐条插入，SQLite的executemany对于不同结构的字典支持有限
-            for match_data in matches_data:
-                # 提取数据字段和值
-                keys = []
-                values = []
-                placeholders = []
-
-                for key, value in match_data.items():
-                    # 处理关键字字段AS
-                    col_name = "[AS]" if key == "AS" else key
-                    keys.append(col_name)
-                    values.append(value)
-                    placeholders.append("?")
-
-                # 构建SQL语句
-                sql = f"INSERT INTO matches ({', '.join(keys)}) VALUES ({', '.join(placeholders)})"
-
-                # 执行插入
-                self.cursor.execute(sql, values)
-                inserted_ids.append(str(self.cursor.lastrowid))
-
-            # 提交事务
-            self.conn.commit()
+            # 按字段组合（与字段顺序无关）将记录分组，同时记录每条记录在输入中的位置
+            groups = defaultdict(lambda: ([], []))
+            for position, match_data in enumerate(matches_data):
+                keys = tuple(sorted(match_data))
+                positions, rows = groups[keys]
+                positions.append(position)
+                rows.append(tuple(map(match_data.__getitem__, keys)))
+
+            for keys in groups:
+                self._check_columns(keys)
+
+            ids = [None] * len(matches_data)
+            ignored_count = 0
+
+            # 每组分批插入，所有分组都在同一个事务中执行，退出with块时统一提交
+            with self.bulk():
+                for keys, (positions, rows) in groups.items():
+                    for position, row_id in zip(
+                        positions, self._insert_rows(keys, rows)
+                    ):
+                        if row_id is None:
+                            ignored_count += 1
+                        else:
+                            ids[position] = str(row_id)
+
+            if ignored_count:
+                logger.warning(f"{ignored_count} 条比赛数据因重复被忽略")
+
+            # 按输入顺序返回ID
+            inserted_ids = [row_id for row_id in ids if row_id is not None]
+
             logger.info(f"成功批量保存 {len(inserted_ids)} 条比赛数据")
             return inserted_ids
         except Exception as e:
             logger.error(f"批量保存比赛数据时出错: {e}")
-            if self.conn:
-                self.conn.rollback()
             return None
 
-    def get_matches(self, filters=None, limit=None):
+    def _insert_rows(self, columns, rows):
         """
-        获取比赛数据
+        批量插入同一字段组合的多条记录，需要在事务中调用
 
         Args:
-            filters (dict): 查询过滤条件
-            limit (int, None): 返回结果的最大数量，设为None时不限制数量
+            columns (tuple): 排序后的字段名元组
+            rows (list): 与字段顺序对应的取值元组列表
 
         Returns:
-            list: 比赛数据列表
+            list: 与rows一一对应的新记录ID，被唯一约束忽略的记录为None
         """
-        # 如果连接可用，从数据库获取数据
-        if self.is_connected():
-            try:
-                # 输出检索命令到控制台
-                print(
-                    f"执行SQLite查询: 数据库='{self.db_path}', 查询条件={filters}, 限制={limit if limit is not None else '无限制'}"
+        if _SUPPORTS_RETURNING:
+            ids = []
+            # 多行VALUES + RETURNING：每批一次执行即可取回全部新ID
+            batch_size = max(
+                1, min(_MAX_ROWS_PER_INSERT, self._max_variables() // len(columns))
+            )
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start : start + batch_size]
+                self.cursor.execute("SAVEPOINT insert_batch")
+                self.cursor.execute(
+                    _insert_returning_sql(columns, len(batch)),
+                    list(chain.from_iterable(batch)),
                 )
+                # RETURNING的返回顺序不保证与插入顺序一致，按ID排序还原
+                batch_ids = sorted(row[0] for row in self.cursor.fetchall())
+                ids.extend(self._finish_batch(columns, batch, batch_ids))
+            return ids
+
+        # 旧版本SQLite：executemany后根据last_insert_rowid还原ID
+        # 同一事务内AUTOINCREMENT分配的ID是连续的
+        self.cursor.execute("SAVEPOINT insert_batch")
+        self.cursor.executemany(_insert_sql(columns), rows)
+        inserted_count = self.cursor.rowcount
+        self.cursor.execute("SELECT last_insert_rowid()")
+        last_id = self.cursor.fetchone()[0]
+        batch_ids = list(range(last_id - inserted_count + 1, last_id + 1))
+        return self._finish_batch(columns, rows, batch_ids)
+
+    def _finish_batch(self, columns, batch, batch_ids):
+        """
+        结束以SAVEPOINT insert_batch开始的一批插入
+        若有记录因唯一约束被忽略，无法确定各ID对应哪条记录，则撤销本批并逐行重新插入
 
-                # 构建SQL查询
-                query = "SELECT * FROM matches"
-                params = []
+        Args:
+            columns (tuple): 排序后的字段名元组
+            batch (list): 本批的取值元组列表
+            batch_ids (list): 本批新记录ID的升序列表
 
-                # 处理过滤条件
-                if filters:
-                    where_clauses = []
-                    for key, value in filters.items():
-                        # 处理关键字字段AS
-                        if key == "AS":
-                            key = "[AS]"
-                        where_clauses.append(f"{key} = ?")
-                        params.append(value)
+        Returns:
+            list: 与batch一一对应的新记录ID，被忽略的记录为None
+        """
+        cursor = self.cursor
+        if len(batch_ids) == len(batch):
+            cursor.execute("RELEASE insert_batch")
+            return batch_ids
+
+        cursor.execute("ROLLBACK TO insert_batch")
+        cursor.execute("RELEASE insert_batch")
+        sql = _insert_sql(columns)
+        ids = []
+        for row in batch:
+            cursor.execute(sql, row)
+            # 被忽略的插入不改变记录数，lastrowid仍是上一条插入的ID
+            ids.append(cursor.lastrowid if cursor.rowcount else None)
+        return ids
+
+    def _iter_matches(self, filters=None, limit=None, projection=None):
+        """
+        执行比赛数据查询，并分批从数据库读取、逐条生成结果
+        使用独立的游标，遍历期间可以在同一连接上执行其他查询；出错时直接抛出异常
 
-                    if where_clauses:
-                        query += " WHERE " + " AND ".join(where_clauses)
+        Args:
+            filters (dict): 查询过滤条件
+            limit (int, None): 返回结果的最大数量，设为None时不限制数量
+            projection (list, None): 需要返回的字段列表，设为None时返回全部字段
+
+        Yields:
+            dict: 比赛数据字典
+        """
+        # 构建SQL查询，只选取需要的字段
+        columns = list(projection) if projection else self._get_columns()
+        self._check_columns(columns)
+        if filters:
+            self._check_columns(filters)
+        select_cols = ", ".join(_QUOTE(col, col) for col in columns) or "*"
+        query = f"SELECT {select_cols} FROM matches"
+        params = []
+
+        # 处理过滤条件
+        if filters:
+            where_clauses = []
+            for key, value in filters.items():
+                # 处理关键字字段AS
+                where_clauses.append(f"{_QUOTE(key, key)} = ?")
+                params.append(value)
 
-                # 添加排序：按日期从早到晚排序
-                query += " ORDER BY Date ASC"
+            if where_clauses:
+                query += " WHERE " + " AND ".join(where_clauses)
 
-                # 添加限制
-                if limit is not None:
-                    query += f" LIMIT {limit}"
+        # 添加排序：按日期从早到晚排序
+        query += " ORDER BY Date ASC"
 
-                # 执行查询
-                self.cursor.execute(query, params)
+        # 添加限制
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
 
-                # 获取列名
-                columns = [desc[0] for desc in self.cursor.description]
+        # 只有查询了Date字段时才需要处理日期格式
+        normalize_date = self._normalize_date if "Date" in columns else None
 
-                # 转换结果为字典列表
-                matches = []
-                for row in self.cursor.fetchall():
-                    match_dict = {}
-                    for i, col in enumerate(columns):
-                        # 移除方括号（如果有的话）
-                        if col.startswith("[") and col.endswith("]"):
-                            col = col[1:-1]
-
-                        # 处理Date字段，确保它是时间戳格式
-                        if col == "Date" and row[i] is not None:
-                            # 如果已经是整数类型，直接保留（时间戳格式）
-                            if isinstance(row[i], int):
-                                match_dict[col] = row[i]
-                            else:
-                                # 如果是字符串，尝试转换为时间戳
-                                try:
-                                    # 尝试将字符串转换为时间戳
-                                    # 注意：这里根据实际存储格式可能需要调整
-                                    timestamp = int(row[i])
-                                    match_dict[col] = timestamp
-                                except (ValueError, TypeError):
-                                    # 如果无法转换，记录警告并保持原样
-                                    logger.warning(
-                                        f"无法将日期值'{row[i]}'转换为时间戳"
-                                    )
-                                    match_dict[col] = row[i]
-                        else:
-                            match_dict[col] = row[i]
-                    matches.append(match_dict)
+        cursor = self.conn.cursor()
+        try:
+            # 执行查询
+            cursor.execute(query, params)
+
+            # 分批读取结果并转换为字典，避免一次性载入全部行
+            while True:
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                batch = list(map(dict, rows))
+                if normalize_date is not None:
+                    # 处理Date字段，已是整数时间戳的行直接跳过
+                    for match_dict in batch:
+                        if type(match_dict["Date"]) is not int:
+                            normalize_date(match_dict)
+                yield from batch
+        finally:
+            cursor.close()
+
+    def get_matches_iter(self, filters=None, limit=None, projection=None):
+        """
+        逐条获取比赛数据，按需从数据库分批读取，适合只需遍历一次结果的调用方
+
+        Args:
+            filters (dict): 查询过滤条件
+            limit (int, None): 返回结果的最大数量，设为None时不限制数量
+            projection (list, None): 需要返回的字段列表，设为None时返回全部字段
+
+        Yields:
+            dict: 比赛数据字典
+        """
+        if not self._ensure_conn():
+            logger.warning("数据库连接不可用")
+            return
+
+        try:
+            yield from self._iter_matches(filters, limit, projection)
+        except Exception as e:
+            logger.error(f"查询SQLite比赛数据时出错: {e}")
+
+    def get_matches(self, filters=None, limit=None, projection=None):
+        """
+        获取比赛数据
+
+        Args:
+            filters (dict): 查询过滤条件
+            limit (int, None): 返回结果的最大数量，设为None时不限制数量
+            projection (list, None): 需要返回的字段列表，设为None时返回全部字段
+
+        Returns:
+            list: 比赛数据列表
+        """
+        # 如果连接可用，从数据库获取数据
+        if self._ensure_conn():
+            try:
+                # 输出检索命令到调试日志
+                logger.debug(
+                    "执行SQLite查询: 数据库='%s', 查询条件=%s, 限制=%s",
+                    self.db_path,
+                    filters,
+                    limit if limit is not None else "无限制",
+                )
+
+                matches = list(self._iter_matches(filters, limit, projection))
 
-                print(f"SQLite查询结果: 找到{len(matches)}条数据")
                 logger.info(f"成功从SQLite查询到 {len(matches)} 条比赛数据")
 
                 # 如果数据库查询成功但没有找到数据，返回空列表
                 if not matches:
-                    print("SQLite查询返回空结果")
+                    logger.debug("SQLite查询返回空结果")
                     return []
 
-                # 确保返回的数据按日期从早到晚排序
-                # 对于时间戳，我们需要特殊处理排序逻辑
-                matches.sort(
-                    key=lambda x: (
-                        x.get("Date", 0) if isinstance(x.get("Date"), int) else 0
-                    )
-                )
-
-                # 输出前3条数据的简要信息作为示例
-                if matches:
-                    print(f"查询结果示例 (前{min(3, len(matches))}条):")
+                # 调试模式下输出前3条数据的简要信息作为示例
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("查询结果示例 (前%d条):", min(3, len(matches)))
                     for i, match in enumerate(matches[:3]):
-                        div = match.get("Div", "N/A")
-                        date = match.get("Date", "N/A")
-                        home_team = match.get("HomeTeam", "N/A")
-                        away_team = match.get("AwayTeam", "N/A")
-                        print(
-                            f"  数据{i + 1}: 联赛={div}, 日期={date}, 主队={home_team}, 客队={away_team}"
+                        logger.debug(
+                            "  数据%d: 联赛=%s, 日期=%s, 主队=%s, 客队=%s",
+                            i + 1,
+                            match.get("Div", "N/A"),
+                            match.get("Date", "N/A"),
+                            match.get("HomeTeam", "N/A"),
+                            match.get("AwayTeam", "N/A"),
                         )
 
                 return matches
             except Exception as e:
                 logger.error(f"查询SQLite比赛数据时出错: {e}")
-                print(f"SQLite查询出错: {e}")
                 return []
         else:
             # 如果连接不可用，返回空列表
-            print("数据库连接不可用")
+            logger.warning("数据库连接不可用")
             return []
 
     def update_match(self, match_id, update_data):
@@ -327,39 +683,27 @@ class MatchDataManager:
         Returns:
             bool: 更新是否成功
         """
-        if not self.is_connected():
-            if not self._connect():
-                return False
+        if not self._ensure_conn():
+            return False
 
         try:
-            # 构建更新字段
-            update_fields = []
-            params = []
-
-            for key, value in update_data.items():
-                # 处理关键字字段AS
-                col_name = "[AS]" if key == "AS" else key
-                update_fields.append(f"{col_name} = ?")
-                params.append(value)
-
-            # 添加ID参数
+            # 按排序后的字段获取SQL语句，并在更新字段的取值之后添加ID参数
+            columns = tuple(sorted(update_data))
+            self._check_columns(columns)
+            sql = _update_sql(columns)
+            params = [update_data[col] for col in columns]
             params.append(match_id)
 
-            # 构建SQL语句
-            sql = f"UPDATE matches SET {', '.join(update_fields)} WHERE id = ?"
-
             # 执行更新
-            self.cursor.execute(sql, params)
-            self.conn.commit()
+            with self._transaction():
+                self.cursor.execute(sql, params)
 
             # 检查是否有更新
             modified_count = self.cursor.rowcount
-            logger.info(f"更新比赛数据，修改了 {modified_count} 条记录")
+            logger.info("更新比赛数据，修改了 %d 条记录", modified_count)
             return modified_count > 0
         except Exception as e:
             logger.error(f"更新比赛数据时出错: {e}")
-            if self.conn:
-                self.conn.rollback()
             return False
 
     def delete_match(self, match_id):
@@ -372,23 +716,20 @@ class MatchDataManager:
         Returns:
             bool: 删除是否成功
         """
-        if not self.is_connected():
-            if not self._connect():
-                return False
+        if not self._ensure_conn():
+            return False
 
         try:
             # 执行删除
-            self.cursor.execute("DELETE FROM matches WHERE id = ?", (match_id,))
-            self.conn.commit()
+            with self._transaction():
+                self.cursor.execute("DELETE FROM matches WHERE id = ?", (match_id,))
 
             # 检查是否有删除
             deleted_count = self.cursor.rowcount
-            logger.info(f"删除比赛数据，匹配到并删除了 {deleted_count} 条记录")
+            logger.info("删除比赛数据，匹配到并删除了 %d 条记录", deleted_count)
             return deleted_count > 0
         except Exception as e:
             logger.error(f"删除比赛数据时出错: {e}")
-            if self.conn:
-                self.conn.rollback()
             return False
 
     def get_match_by_id(self, match_id):
@@ -401,13 +742,14 @@ class MatchDataManager:
         Returns:
             dict: 比赛数据字典，如果未找到返回None
         """
-        if not self.is_connected():
-            if not self._connect():
-                return None
+        if not self._ensure_conn():
+            return None
 
         try:
-            # 输出检索命令到控制台
-            print(f"执行SQLite查询: 数据库='{self.db_path}', 比赛ID={match_id}")
+            # 输出检索命令到调试日志
+            logger.debug(
+                "执行SQLite查询: 数据库='%s', 比赛ID=%s", self.db_path, match_id
+            )
 
             # 构建SQL查询 - 仅查询指定ID的比赛
             query = "SELECT * FROM matches WHERE id = ?"
@@ -420,55 +762,65 @@ class MatchDataManager:
             row = self.cursor.fetchone()
 
             if not row:
-                print(f"SQLite查询结果: 未找到ID为{match_id}的比赛")
+                logger.debug("SQLite查询结果: 未找到ID为%s的比赛", match_id)
                 return None
 
-            # 获取列名
-            columns = [desc[0] for desc in self.cursor.description]
-
             # 转换结果为字典
-            match_dict = {}
-            for i, col in enumerate(columns):
-                # 移除方括号（如果有的话）
-                if col.startswith("[") and col.endswith("]"):
-                    col = col[1:-1]
-
-                # 处理Date字段，确保它是时间戳格式
-                if col == "Date" and row[i] is not None:
-                    # 如果已经是整数类型，直接保留（时间戳格式）
-                    if isinstance(row[i], int):
-                        match_dict[col] = row[i]
-                    else:
-                        # 如果是字符串，尝试转换为时间戳
-                        try:
-                            # 尝试将字符串转换为时间戳
-                            timestamp = int(row[i])
-                            match_dict[col] = timestamp
-                        except (ValueError, TypeError):
-                            # 如果无法转换，记录警告并保持原样
-                            logger.warning(f"无法将日期值'{row[i]}'转换为时间戳")
-                            match_dict[col] = row[i]
-                else:
-                    match_dict[col] = row[i]
-
-            print(f"SQLite查询结果: 成功找到ID为{match_id}的比赛数据")
-            logger.info(f"成功从SQLite查询到ID为{match_id}的比赛数据")
+            match_dict = self._normalize_date(dict(row))
+
+            logger.info("成功从SQLite查询到ID为%s的比赛数据", match_id)
 
             # 输出查询到的比赛简要信息
-            div = match_dict.get("Div", "N/A")
-            date = match_dict.get("Date", "N/A")
-            home_team = match_dict.get("HomeTeam", "N/A")
-            away_team = match_dict.get("AwayTeam", "N/A")
-            print(
-                f"查询结果: 联赛={div}, 日期={date}, 主队={home_team}, 客队={away_team}"
+            logger.debug(
+                "查询结果: 联赛=%s, 日期=%s, 主队=%s, 客队=%s",
+                match_dict.get("Div", "N/A"),
+                match_dict.get("Date", "N/A"),
+                match_dict.get("HomeTeam", "N/A"),
+                match_dict.get("AwayTeam", "N/A"),
             )
 
             return match_dict
         except Exception as e:
             logger.error(f"查询单场比赛数据时出错: {e}")
-            print(f"SQLite查询出错: {e}")
             return None
 
+    def get_matches_by_ids(self, match_ids):
+        """
+        根据一组比赛ID批量获取比赛数据
+        每批ID用一条IN查询取回，代替逐个调用get_match_by_id
+
+        Args:
+            match_ids (Iterable): 比赛ID列表
+
+        Returns:
+            dict: 比赛ID到比赛数据字典的映射，未找到的ID不在结果中；出错时返回空字典
+        """
+        if not self._ensure_conn():
+            return {}
+
+        # 去重并保持顺序
+        ids = list(dict.fromkeys(match_ids))
+        try:
+            matches = {}
+            max_variables = self._max_variables()
+            for start in range(0, len(ids), max_variables):
+                chunk = ids[start : start + max_variables]
+                placeholders = ", ".join("?" * len(chunk))
+                self.cursor.execute(
+                    f"SELECT * FROM matches WHERE id IN ({placeholders})", chunk
+                )
+                for row in self.cursor.fetchall():
+                    match_dict = self._normalize_date(dict(row))
+                    matches[match_dict["id"]] = match_dict
+
+            logger.debug(
+                "批量查询比赛数据: 请求%d个ID, 找到%d场比赛", len(ids), len(matches)
+            )
+            return matches
+        except Exception as e:
+            logger.error(f"批量查询比赛数据时出错: {e}")
+            return {}
+
     def create_index(self, field_name, unique=False):
         """
         创建SQLite索引以提高查询性能
@@ -480,13 +832,14 @@ class MatchDataManager:
         Returns:
             bool: 创建是否成功
         """
-        if not self.is_connected():
-            if not self._connect():
-                return False
+        if not self._ensure_conn():
+            return False
 
         try:
+            self._check_columns((field_name,))
+
             # 处理关键字字段AS
-            col_name = "[AS]" if field_name == "AS" else field_name
+            col_name = _QUOTE(field_name, field_name)
             index_name = f"idx_{col_name}"
 
             # 检查索引是否已存在
@@ -500,35 +853,30 @@ class MatchDataManager:
 
             # 创建索引
             index_sql = f"CREATE {'UNIQUE' if unique else ''} INDEX {index_name} ON matches ({col_name})"
-            self.cursor.execute(index_sql)
-            self.conn.commit()
+            with self._transaction():
+                self.cursor.execute(index_sql)
             logger.info(f"成功创建索引: {index_name} on {col_name}")
             return True
         except Exception as e:
             logger.error(f"创建索引时出错: {e}")
-            if self.conn:
-                self.conn.rollback()
             return False
 
     def close(self):
         """
-        关闭SQLite连接
+        关闭连接池中当前数据库的所有连接，包括其他线程的连接
+        只应在没有其他线程使用同一数据库时调用（如程序退出前）；
+        工作线程的连接在线程结束时会自动关闭，无需调用close()
+        共享同一数据库的其他实例会在下次访问时重新建立连接
         """
-        if self.conn:
+        with self._pool_lock:
+            connections = self._shared.reset()
+
+        for conn in list(connections):
             try:
-                self.conn.close()
+                conn.close()
                 logger.info("SQLite连接已关闭")
             except Exception as e:
                 logger.error(f"关闭SQLite连接时出错: {e}")
-            finally:
-                self.conn = None
-                self.cursor = None
-
-    def __del__(self):
-        """
-        析构函数，确保连接被关闭
-        """
-        self.close()
 
     def get_league_matches(self, league_name, season=None, limit=None):
         """
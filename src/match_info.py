@@ -1,7 +1,9 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 
+@dataclass(slots=True, eq=False, repr=False)
 class MatchInfo:
     """
     比赛信息类，用于存储比赛相关的详细数据
@@ -14,24 +16,11 @@ class MatchInfo:
         match_date: datetime 比赛日期
     """
 
-    def __init__(
-        self, match_id: int, mu: float, elo: float, sigma: float, match_date: datetime
-    ):
-        """
-        初始化MatchInfo对象
-
-        参数:
-            match_id: 比赛数据库中的id值
-            mu: 比赛之后的mu值
-            elo: 比赛之后的elo值
-            sigma: 比赛之后的sigma值
-            match_date: 比赛日期
-        """
-        self.match_id = match_id
-        self.mu = mu
-        self.elo = elo
-        self.sigma = sigma
-        self.match_date = match_date
+    match_id: int
+    mu: float
+    elo: float
+    sigma: float
+    match_date: datetime
 
     def __str__(self) -> str:
         """返回对象的字符串表示"""
@@ -1,8 +1,48 @@
 import glob
+import math
 import os
+import re
+from operator import itemgetter
+import numpy as np
 import pandas as pd
 from openskill.models import PlackettLuce
 
+# numba为可选依赖，安装后Elo批量更新循环会被编译为本地代码
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _run_elo(home_ids, away_ids, actual_home, actual_away, ratings, k_factor):
+    """
+    按顺序逐场更新Elo评分，直接修改ratings
+    只使用下标访问和浮点运算，既可按Python列表解释执行，也可由numba编译
+
+    Args:
+        home_ids: 每场比赛主队的整数ID
+        away_ids: 每场比赛客队的整数ID
+        actual_home: 每场比赛主队的实际结果（1/0.5/0）
+        actual_away: 每场比赛客队的实际结果（1/0.5/0）
+        ratings: 按队伍ID索引的评分
+        k_factor (float): K系数
+    """
+    for i in range(len(home_ids)):
+        home_id = home_ids[i]
+        away_id = away_ids[i]
+        home_rating = ratings[home_id]
+        away_rating = ratings[away_id]
+        exp_home = 1 / (1 + math.pow(10.0, (away_rating - home_rating) / 400))
+        exp_away = 1 - exp_home
+        ratings[home_id] = home_rating + k_factor * (actual_home[i] - exp_home)
+        ratings[away_id] = away_rating + k_factor * (actual_away[i] - exp_away)
+
+
+_run_elo_compiled = njit(cache=True)(_run_elo) if njit is not None else None
+
+# 从文件名（如"E0 2019-20.csv"）中提取起始年份：第一个空格之后到"-"之前的部分
+_YEAR_RE = re.compile(r"[^ ]* ([^ -]*)")
+
 
 class EloAlgorithm:
     """Elo评级算法实现"""
@@ -11,10 +51,13 @@ class EloAlgorithm:
         self.initial_rating = initial_rating
         self.k_factor = k_factor
         self.teams = {}
+        # 评分版本号，评分变化时递增；排名缓存为(版本号, 排序结果)
+        self._version = 0
+        self._rankings_cache = None
 
     def expected_result(self, rating_a, rating_b):
         """计算预期结果概率"""
-        return 1 / (1 + 10 ** ((rating_b - rating_a) / 400))
+        return 1 / (1 + math.pow(10.0, (rating_b - rating_a) / 400))
 
     def update_elo(self, rating, expected, actual):
         """更新Elo评分"""
@@ -24,6 +67,7 @@ class EloAlgorithm:
         """获取或初始化队伍评分"""
         if team_name not in self.teams:
             self.teams[team_name] = self.initial_rating
+            self._version += 1
         return self.teams[team_name]
 
     def process_match(self, home_team, away_team, home_score, away_score):
@@ -51,10 +95,74 @@ class EloAlgorithm:
         # 保存更新后的评分
         self.teams[home_team] = new_home_rating
         self.teams[away_team] = new_away_rating
+        self._version += 1
+
+    def process_matches(self, home_teams, away_teams, home_scores, away_scores):
+        """
+        批量处理按时间顺序排列的比赛结果并更新评分
+        结果与逐场调用process_match相同，但循环中只做列表下标访问
+
+        Args:
+            home_teams (list): 主队名称列表
+            away_teams (list): 客队名称列表
+            home_scores (list): 主队进球数列表
+            away_scores (list): 客队进球数列表
+        """
+        # 按首次出现的顺序为队伍分配整数ID，评分保存在按ID索引的列表中
+        team_ids = {}
+        ratings = []
+
+        def get_team_id(team_name):
+            team_id = team_ids.get(team_name)
+            if team_id is None:
+                team_id = team_ids[team_name] = len(ratings)
+                ratings.append(self.teams.get(team_name, self.initial_rating))
+            return team_id
+
+        home_ids = []
+        away_ids = []
+        for home, away in zip(home_teams, away_teams):
+            home_ids.append(get_team_id(home))
+            away_ids.append(get_team_id(away))
+
+        # 预先确定每场比赛的实际结果
+        actual_home = [
+            1.0 if home_score > away_score else 0.0 if home_score < away_score else 0.5
+            for home_score, away_score in zip(home_scores, away_scores)
+        ]
+        actual_away = [1.0 - actual for actual in actual_home]
+
+        # 评分依赖前一场比赛的结果，只能按顺序逐场更新
+        if _run_elo_compiled is not None:
+            rating_array = np.array(ratings, dtype=np.float64)
+            _run_elo_compiled(
+                np.array(home_ids, dtype=np.int64),
+                np.array(away_ids, dtype=np.int64),
+                np.array(actual_home, dtype=np.float64),
+                np.array(actual_away, dtype=np.float64),
+                rating_array,
+                float(self.k_factor),
+            )
+            ratings = rating_array.tolist()
+        else:
+            _run_elo(
+                home_ids, away_ids, actual_home, actual_away, ratings, self.k_factor
+            )
+
+        # 写回队伍评分
+        for team_name, team_id in team_ids.items():
+            self.teams[team_name] = ratings[team_id]
+        self._version += 1
 
     def get_rankings(self):
         """获取排序后的排名"""
-        return sorted(self.teams.items(), key=lambda x: x[1], reverse=True)
+        # 评分未变化时直接复用上次的排序结果
+        if self._rankings_cache is None or self._rankings_cache[0] != self._version:
+            self._rankings_cache = (
+                self._version,
+                sorted(self.teams.items(), key=itemgetter(1), reverse=True),
+            )
+        return list(self._rankings_cache[1])
 
 
 class OpenSkillAlgorithm:
@@ -63,11 +171,14 @@ class OpenSkillAlgorithm:
     def __init__(self):
         self.model = PlackettLuce()
         self.teams = {}
+        self._version = 0
+        self._rankings_cache = None
 
     def get_team_rating(self, team_name):
         """获取或初始化队伍评分"""
         if team_name not in self.teams:
             self.teams[team_name] = [self.model.rating()]  # 创建默认评分
+            self._version += 1
         return self.teams[team_name]
 
     def process_match(self, home_team, away_team, home_score, away_score):
@@ -90,15 +201,25 @@ class OpenSkillAlgorithm:
         # 保存更新后的评分
         self.teams[home_team] = updated_ratings[0]
         self.teams[away_team] = updated_ratings[1]
+        self._version += 1
 
     def get_rankings(self):
-        """获取排序后的排名"""
-        return sorted(self.teams.items(), key=lambda x: x[1][0].mu, reverse=True)
+        """获取排序后的排名，保持(队名, [评分])格式，调用方通过rating[0].mu取值"""
+        # 评分未变化时直接复用上次的排序结果
+        if self._rankings_cache is None or self._rankings_cache[0] != self._version:
+            self._rankings_cache = (
+                self._version,
+                sorted(self.teams.items(), key=lambda x: x[1][0].mu, reverse=True),
+            )
+        return list(self._rankings_cache[1])
 
 
 class MatchRankingSystem:
     """比赛排名统计系统主类"""
 
+    # 排名计算需要从CSV中读取的列
+    USED_COLUMNS = ["Date", "HomeTeam", "AwayTeam", "FTHG", "FTAG"]
+
     def __init__(self, data_dir=None):
         # 使用绝对路径确保正确访问数据
         if data_dir is None:
@@ -116,8 +237,10 @@ class MatchRankingSystem:
 
     def _extract_year(self, filename):
         """从文件名提取起始年份"""
-        base = os.path.basename(filename)
-        year_str = base.split(" ")[1].split("-")[0]
+        match = _YEAR_RE.match(os.path.basename(filename))
+        if match is None:
+            raise ValueError(f"无法从文件名提取年份: {filename}")
+        year_str = match.group(1)
         if len(year_str) == 2:
             return int("20" + year_str)
         return int(year_str)
@@ -130,15 +253,25 @@ class MatchRankingSystem:
         # 按年份排序文件
         sorted_files = sorted(files, key=self._extract_year)
 
-        # 初始化并连接所有数据
-        self.all_data = pd.DataFrame()
-        for file in sorted_files:
-            df_temp = pd.read_csv(file)
-            self.all_data = pd.concat([self.all_data, df_temp], ignore_index=True)
+        # 先读取所有文件（只读取排名计算需要的列），再一次性连接
+        frames = [pd.read_csv(file, usecols=self.USED_COLUMNS) for file in sorted_files]
+        self.all_data = (
+            pd.concat(frames, ignore_index=True)
+            if frames
+            else pd.DataFrame(columns=self.USED_COLUMNS)
+        )
+
+        # 队名重复度高，以category类型存储以节省内存
+        for column in ("HomeTeam", "AwayTeam"):
+            self.all_data[column] = self.all_data[column].astype("category")
 
-        # 转换日期并排序
+        # 转换日期并排序，重复的日期字符串只解析一次
         self.all_data["Date"] = pd.to_datetime(
-            self.all_data["Date"], format="%d/%m/%Y", dayfirst=True, errors="coerce"
+            self.all_data["Date"],
+            format="%d/%m/%Y",
+            dayfirst=True,
+            errors="coerce",
+            cache=True,
         )
         self.all_data = self.all_data.sort_values("Date").reset_index(drop=True)
 
@@ -154,14 +287,22 @@ class MatchRankingSystem:
         if self.all_data is None:
             self.load_data()
 
-        for _, row in self.all_data.iterrows():
-            home = row["HomeTeam"]
-            away = row["AwayTeam"]
-            home_score = int(row["FTHG"])
-            away_score = int(row["FTAG"])
+        # 一次性取出各列
+        data = self.all_data
+        home_teams = data["HomeTeam"].tolist()
+        away_teams = data["AwayTeam"].tolist()
+        home_scores = data["FTHG"].astype(int).tolist()
+        away_scores = data["FTAG"].astype(int).tolist()
+
+        # Elo评分批量处理
+        self.elo_algorithm.process_matches(
+            home_teams, away_teams, home_scores, away_scores
+        )
 
-            # 使用两种算法处理同一场比赛
-            self.elo_algorithm.process_match(home, away, home_score, away_score)
+        # OpenSkill评分逐场处理
+        for home, away, home_score, away_score in zip(
+            home_teams, away_teams, home_scores, away_scores
+        ):
             self.openskill_algorithm.process_match(home, away, home_score, away_score)
 
     def get_elo_rankings(self):
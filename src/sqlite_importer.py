@@ -1,14 +1,184 @@
 import sqlite3
 import os
+import re
 import csv
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+
+from .sqlite_schema import PRAGMA_SCRIPT, SECONDARY_INDEXES, create_index_sql
 
-# 配置日志
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 单条多行INSERT语句最多包含的行数，实际行数还受连接的参数数量上限限制
+_MAX_ROWS_PER_INSERT = 64
+
+# 每批缓存的行数，按多行INSERT拆分后剩余的行使用executemany插入
+_BATCH_SIZE = 80 * _MAX_ROWS_PER_INSERT
+
+# 读取CSV文件的缓冲区大小（1MB），减少大文件导入时的read系统调用次数
+_READ_BUFFER_SIZE = 1 << 20
+
+# 从CSV导入到matches表的字段，顺序即插入语句中参数的顺序
+_COLUMNS = (
+    "Div",
+    "Date",
+    "HomeTeam",
+    "AwayTeam",
+    "FTHG",
+    "FTAG",
+    "FTR",
+    "HTHG",
+    "HTAG",
+    "HTR",
+    "Referee",
+    "HS",
+    "AS",
+    "HST",
+    "AST",
+    "HF",
+    "AF",
+    "HC",
+    "AC",
+    "HY",
+    "AY",
+    "HR",
+    "AR",
+)
+
+# 插入语句对所有行都相同，模块加载时构建一次；对AS关键字字段使用方括号
+_INSERT_SQL = "INSERT OR IGNORE INTO matches ({}) VALUES ({})".format(
+    ", ".join("[AS]" if col == "AS" else col for col in _COLUMNS),
+    ", ".join("?" * len(_COLUMNS)),
+)
+_DATE_POS = _COLUMNS.index("Date")
+
+
+@lru_cache(maxsize=8)
+def _multi_insert_sql(row_count: int) -> str:
+    """
+    构建一次插入多行的INSERT语句，参数按行依次展开，相同行数只构建一次
+
+    Args:
+        row_count (int): 每条语句插入的行数
+
+    Returns:
+        str: INSERT OR IGNORE ... VALUES (...), (...)语句
+    """
+    return "INSERT OR IGNORE INTO matches ({}) VALUES {}".format(
+        ", ".join("[AS]" if col == "AS" else col for col in _COLUMNS),
+        ", ".join(["({})".format(", ".join("?" * len(_COLUMNS)))] * row_count),
+    )
+
+
+# 常见日期写法：日/月/两位或四位年份，可带逗号或空格分隔的时:分，
+# 如 '14/08/10'、'12/08/2017'、'14/08/10,18:00'、'21/08/2020 18:00'
+_DATE_RE = re.compile(
+    r"([0-9]{2})/([0-9]{2})/([0-9]{2}|[0-9]{4})(?:[ ,]([0-9]{2}):([0-9]{2}))?"
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[int]:
+    """
+    将CSV中的日期字符串转换为时间戳
+    同一天的多场比赛日期字符串相同，结果按字符串缓存，每种写法只解析一次
+
+    Args:
+        date_str (str): 日期字符串，如 '12/08/2017'、'14/08/10'、'21/08/2020,18:00'
+
+    Returns:
+        Optional[int]: 时间戳，无法解析时返回None
+    """
+    # 常见写法用一次正则匹配取出各字段，直接构造datetime
+    match = _DATE_RE.fullmatch(date_str)
+    if match is not None:
+        day, month, year, hour, minute = match.groups()
+        year_value = int(year)
+        if len(year) == 2:
+            # 与strptime的%y一致：69-99为19xx，00-68为20xx
+            year_value += 1900 if year_value >= 69 else 2000
+        try:
+            if hour is None:
+                # 只有日期没有时间时补充18:00
+                dt = datetime(year_value, int(month), int(day), 18, 0)
+            else:
+                dt = datetime(year_value, int(month), int(day), int(hour), int(minute))
+        except ValueError:
+            pass
+        else:
+            return int(dt.timestamp())
+    # 其他写法按原有顺序逐一尝试
+    return _parse_date_fallback(date_str)
+
+
+def _parse_date_fallback(date_str: str) -> Optional[int]:
+    """
+    依次尝试各种日期格式，处理_DATE_RE之外的写法
+
+    Args:
+        date_str (str): 日期字符串
+
+    Returns:
+        Optional[int]: 时间戳，无法解析时返回None
+    """
+    timestamp = None
+    try:
+        # 尝试多种日期格式解析
+        # 首先尝试格式1: '21/08/2020,18:00'（包含逗号分隔的时间）
+        if "," in date_str:
+            date_parts = date_str.split(",")
+            date_part = date_parts[0].strip()
+            time_part = date_parts[1].strip()
+            # 检查date_part是否为简写年份格式
+            if len(date_part) == 8 and date_part.count("/") == 2:
+                # 尝试简写年份格式 '14/08/10'
+                try:
+                    dt = datetime.strptime(f"{date_part} {time_part}", "%d/%m/%y %H:%M")
+                    timestamp = int(dt.timestamp())
+                except ValueError:
+                    # 如果简写年份失败，尝试完整年份
+                    dt = datetime.strptime(f"{date_part} {time_part}", "%d/%m/%Y %H:%M")
+                    timestamp = int(dt.timestamp())
+            else:
+                # 默认使用完整年份格式
+                dt = datetime.strptime(f"{date_part} {time_part}", "%d/%m/%Y %H:%M")
+                timestamp = int(dt.timestamp())
+        else:
+            # 尝试格式2: '12/08/2017'（不包含时间）
+            try:
+                # 先尝试直接解析为日期
+                if len(date_str) == 8 and date_str.count("/") == 2:
+                    # 尝试简写年份格式 '14/08/10'
+                    dt = datetime.strptime(date_str, "%d/%m/%y")
+                else:
+                    # 默认使用完整年份格式
+                    dt = datetime.strptime(date_str, "%d/%m/%Y")
+                # 补充18:00时间
+                dt = dt.replace(hour=18, minute=0, second=0)
+                timestamp = int(dt.timestamp())
+            except ValueError:
+                # 尝试格式3: '21/08/2020 18:00'（空格分隔的时间）
+                # 检查是否包含时间的简写年份格式
+                if len(date_str) > 8 and date_str.count("/") == 2 and " " in date_str:
+                    try:
+                        dt = datetime.strptime(date_str, "%d/%m/%y %H:%M")
+                        timestamp = int(dt.timestamp())
+                    except ValueError:
+                        dt = datetime.strptime(date_str, "%d/%m/%Y %H:%M")
+                        timestamp = int(dt.timestamp())
+                else:
+                    dt = datetime.strptime(date_str, "%d/%m/%Y %H:%M")
+                    timestamp = int(dt.timestamp())
+    except ValueError:
+        # 如果所有格式都解析失败，记录警告
+        logger.warning(f"无法解析日期格式: {date_str}")
+        timestamp = None
+    return timestamp
+
 
 class SQLiteImporter:
     """
@@ -36,7 +206,8 @@ class SQLiteImporter:
         if not hasattr(self, "_initialized"):
             self.db_path = db_path
             self.conn = None
-            self.cursor = None
+            # 保护共享连接：同一时间只允许一个线程初始化、导入或关闭
+            self._lock = threading.RLock()
             self._initialized = True
             # 初始化数据库连接
             self._init_db()
@@ -50,8 +221,9 @@ class SQLiteImporter:
             db_exists = os.path.exists(self.db_path)
 
             # 建立数据库连接
-            self.conn = sqlite3.connect(self.db_path)
-            self.cursor = self.conn.cursor()
+            # 连接可能被不同线程使用，访问由self._lock串行化
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._apply_pragmas()
 
             if not db_exists:
                 logger.info(f"创建新的SQLite数据库: {self.db_path}")
@@ -67,18 +239,28 @@ class SQLiteImporter:
             if self.conn:
                 self.conn.close()
             self.conn = None
-            self.cursor = None
+
+    def _apply_pragmas(self):
+        """
+        为导入连接设置日志模式、同步级别和缓存大小
+        设置失败（如只读文件系统）时保留默认设置继续导入
+        """
+        try:
+            self.conn.executescript(PRAGMA_SCRIPT)
+        except Exception as e:
+            logger.warning(f"设置SQLite连接参数时出错: {e}")
 
     def _create_matches_table(self):
         """
         创建matches表（如果不存在）
         """
         try:
+            cursor = self.conn.cursor()
             # 检查表是否存在
-            self.cursor.execute(
+            cursor.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='matches'"
             )
-            table_exists = self.cursor.fetchone() is not None
+            table_exists = cursor.fetchone() is not None
 
             if not table_exists:
                 # 创建matches表
@@ -112,24 +294,71 @@ class SQLiteImporter:
                     UNIQUE(Div, Date, HomeTeam, AwayTeam) ON CONFLICT IGNORE
                 )
                 """
-                self.cursor.execute(create_table_sql)
+                cursor.execute(create_table_sql)
                 self.conn.commit()
                 logger.info("成功创建matches表")
             else:
                 logger.info("matches表已存在")
 
+            self._create_secondary_indexes(cursor)
+            self.conn.commit()
+
         except Exception as e:
             logger.error(f"创建matches表时出错: {str(e)}")
             if self.conn:
                 self.conn.rollback()
 
-    def import_csv(self, csv_file_path: str) -> Dict[str, Any]:
+    def _rows_per_insert(self) -> int:
+        """
+        根据连接的参数数量上限计算每条多行INSERT语句的行数
+        SQLite 3.32之前默认上限为999，之后为32766，编译时也可能被修改
+
+        Returns:
+            int: 每条语句插入的行数，不超过_MAX_ROWS_PER_INSERT
+        """
+        max_variables = self.conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        return max(1, min(_MAX_ROWS_PER_INSERT, max_variables // len(_COLUMNS)))
+
+    @staticmethod
+    def _insert_batch(cursor: sqlite3.Cursor, batch: List[list], rows_per_insert: int):
+        """
+        将一批行写入matches表：每rows_per_insert行合并为一条多行INSERT，
+        剩余不足一组的行使用executemany逐行插入
+
+        Args:
+            cursor (sqlite3.Cursor): 执行插入语句的游标
+            batch (List[list]): 按_COLUMNS顺序排列的行数据
+            rows_per_insert (int): 每条多行INSERT语句插入的行数
+        """
+        sql = _multi_insert_sql(rows_per_insert)
+        full = len(batch) - len(batch) % rows_per_insert
+        for start in range(0, full, rows_per_insert):
+            cursor.execute(
+                sql, list(chain.from_iterable(batch[start : start + rows_per_insert]))
+            )
+        if full < len(batch):
+            cursor.executemany(_INSERT_SQL, batch[full:])
+
+    @staticmethod
+    def _create_secondary_indexes(cursor: sqlite3.Cursor):
+        """
+        创建SECONDARY_INDEXES中的查询索引（已存在则跳过）
+
+        Args:
+            cursor (sqlite3.Cursor): 执行建索引语句的游标
+        """
+        for name in SECONDARY_INDEXES:
+            cursor.execute(create_index_sql(name))
+
+    def import_csv(self, csv_file_path: str, fast: bool = False) -> Dict[str, Any]:
         """
         从CSV文件导入数据到matches表
         实现数据重复性检查，确保不插入重复数据
 
         Args:
             csv_file_path (str): CSV文件路径
+            fast (bool): 是否在本次导入期间关闭同步写盘（synchronous=OFF），
+                速度更快，但导入过程中断电或系统崩溃可能损坏数据库
 
         Returns:
             Dict[str, Any]: 导入结果统计信息
@@ -139,6 +368,13 @@ class SQLiteImporter:
                 - skipped_rows: 因重复而跳过的行数
                 - error: 错误信息（如果有）
         """
+        with self._lock:
+            return self._import_csv(csv_file_path, fast)
+
+    def _import_csv(self, csv_file_path: str, fast: bool) -> Dict[str, Any]:
+        """
+        import_csv的实现，调用方需持有self._lock
+        """
         result = {
             "success": False,
             "total_rows": 0,
@@ -148,163 +384,95 @@ class SQLiteImporter:
         }
 
         try:
-            # 检查数据库连接是否有效
+            # 没有连接时先初始化
             if not self.conn:
                 self._init_db()
-            else:
-                # 尝试执行简单的SQL语句来测试连接是否仍然有效
-                try:
-                    self.cursor.execute("SELECT 1")
-                except (sqlite3.OperationalError, AttributeError):
-                    # 如果连接已关闭或cursor无效，重新初始化
-                    self._init_db()
 
             # 检查CSV文件是否存在
             if not os.path.exists(csv_file_path):
                 raise FileNotFoundError(f"CSV文件不存在: {csv_file_path}")
 
             logger.info(f"开始导入CSV文件: {csv_file_path}")
+            # 每次导入使用自己的游标，不与其他调用共享；
+            # 创建游标即可发现连接已被关闭，此时重新初始化，无需额外的探测语句
+            try:
+                cursor = self.conn.cursor()
+            except sqlite3.ProgrammingError:
+                self._init_db()
+                cursor = self.conn.cursor()
+            if fast:
+                cursor.execute("PRAGMA synchronous=OFF")
 
             # 读取CSV文件并导入数据
-            with open(csv_file_path, "r", encoding="utf-8", newline="") as csvfile:
-                csv_reader = csv.DictReader(csvfile)
+            with open(
+                csv_file_path,
+                "r",
+                encoding="utf-8",
+                newline="",
+                buffering=_READ_BUFFER_SIZE,
+            ) as csvfile:
+                csv_reader = csv.reader(csvfile)
+                header = next(csv_reader, [])
+                width = len(header)
+                # 表头只读一次，得到每个字段在行中的位置；同名表头与DictReader一致取最后一列，
+                # CSV中缺少的字段指向每行末尾追加的空字符串
+                positions = {name: index for index, name in enumerate(header)}
+                indexes = [positions.get(col, width) for col in _COLUMNS]
+                date_index = indexes[_DATE_POS]
                 total_rows = 0
-                imported_rows = 0
-                skipped_rows = 0
-
-                for row in csv_reader:
-                    total_rows += 1
-
-                    # 准备要插入的数据
-                    # 只提取表中存在的字段
-
-                    # 处理Date字段，转换为时间戳
-                    date_str = row.get("Date", "")
-                    timestamp = None
-
-                    if date_str:
-                        try:
-                            # 尝试多种日期格式解析
-                            # 首先尝试格式1: '21/08/2020,18:00'（包含逗号分隔的时间）
-                            if "," in date_str:
-                                date_parts = date_str.split(",")
-                                date_part = date_parts[0].strip()
-                                time_part = date_parts[1].strip()
-                                # 检查date_part是否为简写年份格式
-                                if len(date_part) == 8 and date_part.count("/") == 2:
-                                    # 尝试简写年份格式 '14/08/10'
-                                    try:
-                                        dt = datetime.strptime(
-                                            f"{date_part} {time_part}", "%d/%m/%y %H:%M"
-                                        )
-                                        timestamp = int(dt.timestamp())
-                                    except ValueError:
-                                        # 如果简写年份失败，尝试完整年份
-                                        dt = datetime.strptime(
-                                            f"{date_part} {time_part}", "%d/%m/%Y %H:%M"
-                                        )
-                                        timestamp = int(dt.timestamp())
-                                else:
-                                    # 默认使用完整年份格式
-                                    dt = datetime.strptime(
-                                        f"{date_part} {time_part}", "%d/%m/%Y %H:%M"
-                                    )
-                                    timestamp = int(dt.timestamp())
-                            else:
-                                # 尝试格式2: '12/08/2017'（不包含时间）
-                                try:
-                                    # 先尝试直接解析为日期
-                                    if len(date_str) == 8 and date_str.count("/") == 2:
-                                        # 尝试简写年份格式 '14/08/10'
-                                        dt = datetime.strptime(date_str, "%d/%m/%y")
-                                    else:
-                                        # 默认使用完整年份格式
-                                        dt = datetime.strptime(date_str, "%d/%m/%Y")
-                                    # 补充18:00时间
-                                    dt = dt.replace(hour=18, minute=0, second=0)
-                                    timestamp = int(dt.timestamp())
-                                except ValueError:
-                                    # 尝试格式3: '21/08/2020 18:00'（空格分隔的时间）
-                                    # 检查是否包含时间的简写年份格式
-                                    if (
-                                        len(date_str) > 8
-                                        and date_str.count("/") == 2
-                                        and " " in date_str
-                                    ):
-                                        try:
-                                            dt = datetime.strptime(
-                                                date_str, "%d/%m/%y %H:%M"
-                                            )
-                                            timestamp = int(dt.timestamp())
-                                        except ValueError:
-                                            dt = datetime.strptime(
-                                                date_str, "%d/%m/%Y %H:%M"
-                                            )
-                                            timestamp = int(dt.timestamp())
-                                    else:
-                                        dt = datetime.strptime(
-                                            date_str, "%d/%m/%Y %H:%M"
-                                        )
-                                        timestamp = int(dt.timestamp())
-                        except ValueError:
-                            # 如果所有格式都解析失败，记录警告
-                            logger.warning(f"无法解析日期格式: {date_str}")
-                            timestamp = None
-
-                    data = {
-                        "Div": row.get("Div", ""),
-                        "Date": timestamp,
-                        "HomeTeam": row.get("HomeTeam", ""),
-                        "AwayTeam": row.get("AwayTeam", ""),
-                        "FTHG": row.get("FTHG", ""),
-                        "FTAG": row.get("FTAG", ""),
-                        "FTR": row.get("FTR", ""),
-                        "HTHG": row.get("HTHG", ""),
-                        "HTAG": row.get("HTAG", ""),
-                        "HTR": row.get("HTR", ""),
-                        "Referee": row.get("Referee", ""),
-                        "HS": row.get("HS", ""),
-                        "AS": row.get("AS", ""),
-                        "HST": row.get("HST", ""),
-                        "AST": row.get("AST", ""),
-                        "HF": row.get("HF", ""),
-                        "AF": row.get("AF", ""),
-                        "HC": row.get("HC", ""),
-                        "AC": row.get("AC", ""),
-                        "HY": row.get("HY", ""),
-                        "AY": row.get("AY", ""),
-                        "HR": row.get("HR", ""),
-                        "AR": row.get("AR", ""),
-                    }
-
-                    # 构建插入语句，处理关键字字段
-                    columns = []
-                    for col in data.keys():
-                        # 对AS关键字字段使用方括号
-                        if col == "AS":
-                            columns.append("[AS]")
-                        else:
-                            columns.append(col)
-                    columns_str = ", ".join(columns)
-                    placeholders = ", ".join(["?" for _ in data])
-                    insert_sql = f"INSERT OR IGNORE INTO matches ({columns_str}) VALUES ({placeholders})"
-
-                    # 执行插入
-                    before_count = self.cursor.execute("SELECT changes()").fetchone()[0]
-                    self.cursor.execute(insert_sql, list(data.values()))
-                    after_count = self.cursor.execute("SELECT changes()").fetchone()[0]
-
-                    if after_count > 0:
-                        imported_rows += 1
-                        # 每100行提交一次，避免内存占用过高
-                        if imported_rows % 100 == 0:
-                            self.conn.commit()
-                            logger.info(f"已导入 {imported_rows} 行数据")
-                    else:
-                        skipped_rows += 1
-
-                # 最终提交
-                self.conn.commit()
+                batch = []
+
+                # total_changes只统计实际插入的行，被INSERT OR IGNORE忽略的行不计入
+                changes_before = self.conn.total_changes
+
+                # 所有行在同一个事务中分批插入，退出with块时统一提交，出错时回滚
+                with self.conn:
+                    # 开始时就取得写锁，避免导入中途因其他连接占用而升级失败
+                    self.conn.execute("BEGIN IMMEDIATE")
+                    # 向空表首次批量导入时先删除查询索引，导入后一次性重建，
+                    # 避免逐行维护B树；唯一约束自带的索引保留，用于去重
+                    rebuild_indexes = (
+                        cursor.execute("SELECT 1 FROM matches LIMIT 1").fetchone()
+                        is None
+                    )
+                    if rebuild_indexes:
+                        for name in SECONDARY_INDEXES:
+                            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+                    parse_date = _parse_date
+                    date_pos = _DATE_POS
+                    append_row = batch.append
+                    insert_batch = self._insert_batch
+                    rows_per_insert = self._rows_per_insert()
+                    for row in csv_reader:
+                        # 与DictReader一致：跳过空行，缺少的值补None，多出的值忽略
+                        if not row:
+                            continue
+                        total_rows += 1
+                        if len(row) != width:
+                            row = row[:width] + [None] * (width - len(row))
+                        row.append("")
+
+                        # 处理Date字段，转换为时间戳
+                        date_str = row[date_index]
+                        timestamp = parse_date(date_str) if date_str else None
+
+                        # 按_COLUMNS的顺序直接绑定参数，Date使用解析后的时间戳
+                        values = [row[index] for index in indexes]
+                        values[date_pos] = timestamp
+                        append_row(values)
+                        if len(batch) >= _BATCH_SIZE:
+                            insert_batch(cursor, batch, rows_per_insert)
+                            batch.clear()
+                            logger.info("已处理 %d 行数据", total_rows)
+
+                    if batch:
+                        insert_batch(cursor, batch, rows_per_insert)
+                    if rebuild_indexes:
+                        self._create_secondary_indexes(cursor)
+
+                imported_rows = self.conn.total_changes - changes_before
+                skipped_rows = total_rows - imported_rows
 
                 result.update(
                     {
@@ -327,6 +495,10 @@ class SQLiteImporter:
             result["error"] = str(e)
             if self.conn:
                 self.conn.rollback()
+        finally:
+            if fast and self.conn:
+                # 恢复CONNECTION_PRAGMAS中的同步级别
+                self.conn.execute("PRAGMA synchronous=NORMAL")
 
         return result
 
@@ -334,13 +506,16 @@ class SQLiteImporter:
         """
         关闭数据库连接
         """
-        if self.conn:
-            try:
-                self.conn.close()
-                logger.info("SQLite数据库连接已关闭")
-            except Exception:
-                # 忽略关闭时的异常，确保连接被释放
-                pass
+        with self._lock:
+            if self.conn:
+                try:
+                    self.conn.close()
+                    logger.info("SQLite数据库连接已关闭")
+                except Exception:
+                    # 忽略关闭时的异常，确保连接被释放
+                    pass
+                # 置空连接，下次导入时直接重新初始化而不是在已关闭的连接上探测
+                self.conn = None
 
     def __del__(self):
         """
@@ -349,5 +524,21 @@ class SQLiteImporter:
         self.close()
 
 
-# 提供一个便捷的全局访问实例
-sqlite_importer = SQLiteImporter()
+def get_sqlite_importer() -> SQLiteImporter:
+    """
+    获取全局SQLite导入器实例，首次调用时才连接数据库
+
+    Returns:
+        SQLiteImporter: 单例导入器
+    """
+    return SQLiteImporter()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    兼容旧的 `from src.sqlite_importer import sqlite_importer` 写法，
+    在首次访问时才创建实例，避免导入模块时就打开数据库
+    """
+    if name == "sqlite_importer":
+        return get_sqlite_importer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,40 @@
+"""
+SQLite数据库公共设置
+MatchDataManager和SQLiteImporter连接同一个数据库文件，共用这里的连接参数和查询索引
+"""
+
+# 每个连接建立后执行的PRAGMA：WAL日志使读写可并发，每个事务只同步一次，
+# 临时表放内存，64MB页缓存，256MB内存映射
+CONNECTION_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+)
+PRAGMA_SCRIPT = "".join(f"PRAGMA {pragma};" for pragma in CONNECTION_PRAGMAS)
+
+# matches表上的查询索引（索引名 -> 字段）：按联赛筛选并按日期排序、按日期排序、
+# 按球队查询其主场/客场比赛
+SECONDARY_INDEXES = {
+    "idx_matches_div_date": "Div, Date",
+    "idx_matches_date": "Date",
+    "idx_matches_home_date": "HomeTeam, Date",
+    "idx_matches_away_date": "AwayTeam, Date",
+}
+
+
+def create_index_sql(name: str) -> str:
+    """
+    构建创建SECONDARY_INDEXES中指定索引的语句（已存在则跳过）
+
+    Args:
+        name (str): 索引名
+
+    Returns:
+        str: CREATE INDEX IF NOT EXISTS语句
+    """
+    return f"CREATE INDEX IF NOT EXISTS {name} ON matches({SECONDARY_INDEXES[name]})"
+
+
+INDEX_SCRIPT = "".join(f"{create_index_sql(name)};" for name in SECONDARY_INDEXES)
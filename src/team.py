@@ -16,6 +16,21 @@ class Team:
         match_info: List[MatchInfo]: 存储队伍历史比赛信息的列表
     """
 
+    __slots__ = (
+        "name",
+        "_elo",
+        "_mu",
+        "_sigma",
+        "_trueskill_rating",
+        "match_count",
+        "league",
+        "match_info",
+    )
+
+    # 所有队伍共用的评级版本号，任一队伍的elo、mu或sigma变化时递增，
+    # TeamManager据此判断排序缓存是否失效
+    rating_revision = 0
+
     def __init__(self, name, elo=1500.0, mu=25.0, sigma=8.333, league=None):
         """
         初始化队伍对象
@@ -28,9 +43,10 @@ class Team:
             league (str, optional): 队伍所在的联赛代码，默认为None
         """
         self.name = name
-        self.elo = elo
-        self.mu = mu
-        self.sigma = sigma
+        self._elo = elo
+        self._mu = mu
+        self._sigma = sigma
+        self._trueskill_rating = 2 * mu - 3 * sigma
         self.match_count = 0
         self.league = league
         self.match_info: List[MatchInfo] = []
@@ -45,11 +61,46 @@ class Team:
             new_sigma (float, optional): 新的TrueSkill sigma值
         """
         if new_elo is not None:
-            self.elo = new_elo
+            self._elo = new_elo
         if new_mu is not None:
-            self.mu = new_mu
+            self._mu = new_mu
         if new_sigma is not None:
-            self.sigma = new_sigma
+            self._sigma = new_sigma
+        if new_mu is not None or new_sigma is not None:
+            self._trueskill_rating = 2 * self._mu - 3 * self._sigma
+        Team.rating_revision += 1
+
+    @property
+    def elo(self):
+        """Elo评分"""
+        return self._elo
+
+    @elo.setter
+    def elo(self, value):
+        self._elo = value
+        Team.rating_revision += 1
+
+    @property
+    def mu(self):
+        """TrueSkill mu值（技能均值）"""
+        return self._mu
+
+    @mu.setter
+    def mu(self, value):
+        self._mu = value
+        self._trueskill_rating = 2 * value - 3 * self._sigma
+        Team.rating_revision += 1
+
+    @property
+    def sigma(self):
+        """TrueSkill sigma值（技能不确定性）"""
+        return self._sigma
+
+    @sigma.setter
+    def sigma(self, value):
+        self._sigma = value
+        self._trueskill_rating = 2 * self._mu - 3 * value
+        Team.rating_revision += 1
 
     def increment_match_count(self):
         """
@@ -78,11 +129,12 @@ class Team:
     def get_trueskill_rating(self):
         """
         获取TrueSkill评级（2*mu - 3*sigma）
+        评级在mu或sigma变化时重新计算，排序时只读取缓存值
 
         返回:
             float: TrueSkill评级
         """
-        return 2 * self.mu - 3 * self.sigma
+        return self._trueskill_rating
 
     def __str__(self):
         """
@@ -1,19 +1,19 @@
 import sys
 import os
+import logging
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QFrame,
     QWidget,
     QCheckBox,
 )
-from PyQt6.QtGui import QPixmap, QFont, QPainter
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap, QFont, QPainter, QBrush
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QPointF
 from PyQt6.QtCharts import (
     QChart,
     QChartView,
@@ -23,12 +23,138 @@ from PyQt6.QtCharts import (
     QLegend,
 )
 from datetime import datetime, timedelta
+from operator import attrgetter
+import numpy as np
 from typing import List, Optional
 from .team import Team
 from .match_info import MatchInfo
 from .team_name_mapper import TeamNameMapper
 from .match_data import MatchDataManager
 
+logger = logging.getLogger(__name__)
+
+# 积分变化图只显示最近的比赛场数
+_RECENT_MATCH_LIMIT = 30
+
+# 是否使用OpenGL绘制积分曲线。图表最多只有30个点，软件绘制已足够；
+# 且Qt无法创建OpenGL上下文时不会报错，只会显示空白曲线，因此默认关闭
+ENABLE_CHART_OPENGL = False
+
+# 积分变化列的前景色，所有单元格共用同一个画刷
+_GREEN_BRUSH = QBrush(Qt.GlobalColor.green)
+_RED_BRUSH = QBrush(Qt.GlobalColor.red)
+
+# 所有对话框共用的TeamNameMapper实例，首次使用时创建
+_MAPPER: Optional[TeamNameMapper] = None
+
+
+def _mapper() -> TeamNameMapper:
+    """
+    获取共用的TeamNameMapper实例，避免每次打开对话框都重新构建映射表
+
+    返回:
+        TeamNameMapper: 共用的队名映射器
+    """
+    global _MAPPER
+    if _MAPPER is None:
+        _MAPPER = TeamNameMapper()
+    return _MAPPER
+
+
+# 缩放后的默认队标，首次打开对话框时加载（QPixmap需要在QApplication创建之后构造）
+_DEFAULT_LOGO: Optional[QPixmap] = None
+
+
+def _default_logo() -> Optional[QPixmap]:
+    """
+    获取缩放到80x80的默认队标图片，只读取和缩放一次
+
+    返回:
+        Optional[QPixmap]: 默认队标图片，图片文件不存在时返回None
+    """
+    global _DEFAULT_LOGO
+    if _DEFAULT_LOGO is None:
+        logo_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "assets",
+            "team_logo",
+            "default.png",
+        )
+        if os.path.exists(logo_path):
+            _DEFAULT_LOGO = QPixmap(logo_path).scaled(
+                80,
+                80,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+    return _DEFAULT_LOGO
+
+
+class MatchHistoryModel(QAbstractTableModel):
+    """
+    历史比赛表格的数据模型
+    每行保存预先格式化好的显示文本，data()直接按列取出，
+    颜色在视图需要时按积分变化值返回，不再为每个单元格创建QTableWidgetItem
+    """
+
+    HEADERS = ("比赛日期", "比赛对手", "比分", "积分", "积分变化")
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        """
+        初始化空的数据模型
+
+        参数:
+            parent: 父对象
+        """
+        super().__init__(parent)
+        # 每行为(日期文本, 对手名称, 比分文本, 积分文本, 积分变化文本, 积分变化)
+        self._rows = []
+
+    def set_rows(self, rows: list):
+        """
+        替换全部行数据并通知视图刷新
+
+        参数:
+            rows: 行数据列表，每行为(日期文本, 对手名称, 比分文本, 积分文本, 积分变化文本, 积分变化)
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """返回比赛行数"""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """返回列数"""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """返回水平表头文字，其余情况沿用默认实现（如垂直表头的行号）"""
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        """返回单元格的显示文本和积分变化列的前景色"""
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[column]
+        if role == Qt.ItemDataRole.ForegroundRole and column == 4:
+            # 积分上升显示绿色，下降显示红色
+            scaled_change = row[5]
+            if scaled_change > 0:
+                return _GREEN_BRUSH
+            if scaled_change < 0:
+                return _RED_BRUSH
+        return None
+
 
 class TeamInfoDialog(QDialog):
     """
@@ -54,9 +180,55 @@ class TeamInfoDialog(QDialog):
         self.match_data_manager = match_data_manager or MatchDataManager()
         self.elo_series = None  # 保存对elo系列的引用
         self.trueskill_series = None  # 保存对trueskill系列的引用
+        self._populated = False  # 图表和表格数据是否已填充
+        self._load_match_infos()
         self._init_ui()
-        # 初始化后更新比赛历史表格
-        self.update_match_history()
+
+    def showEvent(self, event):
+        """
+        对话框首次显示时才填充图表系列和比赛历史表格，之后再次显示不重复填充
+
+        参数:
+            event: 显示事件
+        """
+        super().showEvent(event)
+        if not self._populated:
+            self._populated = True
+            self._populate_chart()
+            # 填充比赛历史表格
+            self.update_match_history()
+
+    def _load_match_infos(self):
+        """
+        读取队伍的历史比赛信息并按日期升序排序一次，供图表和表格共用
+        同时记录每场比赛前一场的mu值，用于计算积分变化，并预先格式化比赛日期文本
+        """
+        self._sorted_matches = sorted(
+            self.team.get_match_info(), key=attrgetter("match_date")
+        )
+        self._prev_mu = {
+            current.match_id: previous.mu
+            for previous, current in zip(self._sorted_matches, self._sorted_matches[1:])
+        }
+        self._date_strs = [
+            match_info.match_date.strftime("%Y-%m-%d")
+            for match_info in self._sorted_matches
+        ]
+        # 图表只显示最近30场比赛，并只保留match_date为有效datetime对象的比赛，
+        # 两条积分曲线共用筛选结果和X轴时间戳（毫秒）
+        self._chart_matches = [
+            match_info
+            for match_info in self._sorted_matches[-_RECENT_MATCH_LIMIT:]
+            if isinstance(match_info.match_date, datetime)
+        ]
+        self._chart_timestamps = np.fromiter(
+            (
+                match_info.match_date.timestamp() * 1000
+                for match_info in self._chart_matches
+            ),
+            dtype=np.float64,
+            count=len(self._chart_matches),
+        )
 
     def _init_ui(self):
         """
@@ -92,20 +264,8 @@ class TeamInfoDialog(QDialog):
 
         # 加载默认队标图片
         logo_label = QLabel(logo_frame)
-        logo_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "assets",
-            "team_logo",
-            "default.png",
-        )
-
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path).scaled(
-                80,
-                80,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
+        pixmap = _default_logo()
+        if pixmap is not None:
             logo_label.setPixmap(pixmap)
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -118,8 +278,7 @@ class TeamInfoDialog(QDialog):
         info_v_layout = QVBoxLayout(info_container)
 
         # 队伍名称 - 使用中文显示
-        team_name_mapper = TeamNameMapper()
-        chinese_team_name = team_name_mapper.get_chinese_name(self.team.name)
+        chinese_team_name = _mapper().get_chinese_name(self.team.name)
         team_name_label = QLabel(chinese_team_name)
         team_name_font = QFont("SimHei", 28, QFont.Weight.Bold)  # 字号从24调整到28
         team_name_label.setFont(team_name_font)
@@ -177,10 +336,10 @@ class TeamInfoDialog(QDialog):
         # 创建图表
         self.chart = QChart()
         # 使用中文队名作为图表标题
-        team_name_mapper = TeamNameMapper()
-        chinese_team_name = team_name_mapper.get_chinese_name(self.team.name)
+        chinese_team_name = _mapper().get_chinese_name(self.team.name)
         self.chart.setTitle(f"{chinese_team_name} 积分变化趋势")
-        self.chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+        # 首次加载数据时不播放动画，用户操作选择框后再开启系列动画
+        self.chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
         self.chart.legend().setVisible(True)
         self.chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
 
@@ -195,22 +354,9 @@ class TeamInfoDialog(QDialog):
         self.axis_y.setTitleText("积分值")
         # 移除固定范围设置，让图表根据数据动态调整Y轴范围
 
-        # 创建并添加数据系列
-        # 根据要求，只保留TrueSkill积分曲线
-        self.elo_series = self._create_elo_series()  # 保留方法调用但不添加到图表
-        self.trueskill_series = self._create_trueskill_series()
-
-        # 只添加TrueSkill系列到图表
-        self.chart.addSeries(self.trueskill_series)
         self.chart.addAxis(self.axis_x, Qt.AlignmentFlag.AlignBottom)
         self.chart.addAxis(self.axis_y, Qt.AlignmentFlag.AlignLeft)
-
-        # 只关联TrueSkill系列到坐标轴
-        self.trueskill_series.attachAxis(self.axis_x)
-        self.trueskill_series.attachAxis(self.axis_y)
-
-        # 动态调整Y轴范围，添加适当边距
-        self._adjust_y_axis_range()
+        # 数据系列在对话框首次显示时由_populate_chart创建
 
         # 创建图表视图
         chart_view = QChartView(self.chart)
@@ -239,11 +385,31 @@ class TeamInfoDialog(QDialog):
         parent_layout.addWidget(chart_frame)
         parent_layout.addSpacing(20)
 
+    def _populate_chart(self):
+        """
+        创建积分数据系列并添加到图表，根据数据调整Y轴范围
+        """
+        # 创建并添加数据系列
+        # 根据要求，只保留TrueSkill积分曲线
+        self.elo_series = self._create_elo_series()  # 保留方法调用但不添加到图表
+        self.trueskill_series = self._create_trueskill_series()
+
+        # 只添加TrueSkill系列到图表
+        self.chart.addSeries(self.trueskill_series)
+
+        # 只关联TrueSkill系列到坐标轴
+        self.trueskill_series.attachAxis(self.axis_x)
+        self.trueskill_series.attachAxis(self.axis_y)
+
+        # 动态调整Y轴范围，添加适当边距
+        self._adjust_y_axis_range()
+
     def _on_elo_checkbox_changed(self, state):
         """
         处理Elo选择框状态变化
         """
         if self.elo_series:
+            self.chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
             is_checked = state == Qt.CheckState.Checked
             self.elo_series.setVisible(is_checked)
 
@@ -258,6 +424,7 @@ class TeamInfoDialog(QDialog):
         处理TrueSkill选择框状态变化
         """
         if self.trueskill_series:
+            self.chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
             is_checked = state == Qt.CheckState.Checked
             self.trueskill_series.setVisible(is_checked)
 
@@ -267,6 +434,18 @@ class TeamInfoDialog(QDialog):
                 self.trueskill_series.attachAxis(self.axis_x)
                 self.trueskill_series.attachAxis(self.axis_y)
 
+    @staticmethod
+    def _configure_series(series: QLineSeries):
+        """
+        设置积分曲线的绘制方式：不绘制数据点标记，开启ENABLE_CHART_OPENGL时使用OpenGL绘制
+
+        参数:
+            series: 要设置的积分曲线
+        """
+        series.setPointsVisible(False)
+        if ENABLE_CHART_OPENGL:
+            series.setUseOpenGL(True)
+
     def _create_elo_series(self) -> QLineSeries:
         """
         创建Elo积分历史系列，使用队伍的实际比赛数据
@@ -274,28 +453,22 @@ class TeamInfoDialog(QDialog):
         """
         series = QLineSeries()
         series.setName("Elo积分")
-
-        # 获取队伍的历史比赛信息
-        match_infos = self.team.get_match_info()
-
-        if match_infos:
-            # 按日期排序
-            sorted_matches = sorted(match_infos, key=lambda x: x.match_date)
-            # 只保留最近30场比赛
-            recent_matches = (
-                sorted_matches[-30:] if len(sorted_matches) > 30 else sorted_matches
+        self._configure_series(series)
+
+        if self._sorted_matches:
+            # 先构建全部数据点，再用replace一次性写入系列
+            points = list(
+                map(
+                    QPointF,
+                    self._chart_timestamps.tolist(),
+                    [match_info.elo for match_info in self._chart_matches],
+                )
             )
-
-            # 添加实际比赛数据
-            for match_info in recent_matches:
-                # 确保match_date是有效的datetime对象
-                if isinstance(match_info.match_date, datetime):
-                    timestamp = match_info.match_date.timestamp() * 1000
-                    series.append(timestamp, match_info.elo)
         else:
             # 如果没有比赛数据，添加当前值作为参考
             today = datetime.now()
-            series.append(today.timestamp() * 1000, self.team.elo)
+            points = [QPointF(today.timestamp() * 1000, self.team.elo)]
+        series.replace(points)
 
         return series
 
@@ -307,31 +480,26 @@ class TeamInfoDialog(QDialog):
         """
         series = QLineSeries()
         series.setName("TrueSkill积分")
-
-        # 获取队伍的历史比赛信息
-        match_infos = self.team.get_match_info()
-
-        if match_infos:
-            # 按日期排序
-            sorted_matches = sorted(match_infos, key=lambda x: x.match_date)
-            # 只保留最近30场比赛
-            recent_matches = (
-                sorted_matches[-30:] if len(sorted_matches) > 30 else sorted_matches
+        self._configure_series(series)
+
+        if self._sorted_matches:
+            x_values = self._chart_timestamps
+            # 将mu值乘以25，保存Y值供_adjust_y_axis_range直接使用
+            self._trueskill_y_values = np.fromiter(
+                (match_info.mu * 25 for match_info in self._chart_matches),
+                dtype=np.float64,
+                count=len(self._chart_matches),
+            )
+            # 先构建全部数据点，再用replace一次性写入系列
+            points = list(
+                map(QPointF, x_values.tolist(), self._trueskill_y_values.tolist())
             )
-
-            # 添加实际比赛数据，并将mu值乘以25
-            for match_info in recent_matches:
-                # 确保match_date是有效的datetime对象
-                if isinstance(match_info.match_date, datetime):
-                    timestamp = match_info.match_date.timestamp() * 1000
-                    # 将mu值乘以25
-                    scaled_mu = match_info.mu * 25
-                    series.append(timestamp, scaled_mu)
         else:
             # 如果没有比赛数据，添加当前值作为参考，并将mu值乘以25
             today = datetime.now()
-            scaled_mu = self.team.mu * 25
-            series.append(today.timestamp() * 1000, scaled_mu)
+            self._trueskill_y_values = np.array([self.team.mu * 25])
+            points = [QPointF(today.timestamp() * 1000, self.team.mu * 25)]
+        series.replace(points)
 
         return series
 
@@ -340,18 +508,14 @@ class TeamInfoDialog(QDialog):
         根据TrueSkill数据动态调整Y轴范围
         添加5%的边距确保数据点完全可见
         """
-        if self.trueskill_series.count() == 0:
+        # 使用创建系列时保存的Y值
+        y_values = self._trueskill_y_values
+        if y_values.size == 0:
             return
 
-        # 获取系列中的所有点
-        points = self.trueskill_series.points()
-
-        # 提取所有Y值
-        y_values = [point.y() for point in points]
-
         # 计算最小和最大值
-        min_y = min(y_values)
-        max_y = max(y_values)
+        min_y = float(y_values.min())
+        max_y = float(y_values.max())
 
         # 计算范围和边距
         value_range = max_y - min_y
@@ -381,12 +545,10 @@ class TeamInfoDialog(QDialog):
         table_frame.setFrameShadow(QFrame.Shadow.Raised)
         table_frame.setMinimumHeight(200)
 
-        # 创建表格
-        self.match_table = QTableWidget()
-        self.match_table.setColumnCount(5)
-        self.match_table.setHorizontalHeaderLabels(
-            ["比赛日期", "比赛对手", "比分", "积分", "积分变化"]
-        )
+        # 创建表格，数据由MatchHistoryModel提供
+        self.match_model = MatchHistoryModel(self)
+        self.match_table = QTableView()
+        self.match_table.setModel(self.match_model)
 
         # 设置表格列宽自适应
         header = self.match_table.horizontalHeader()
@@ -404,50 +566,28 @@ class TeamInfoDialog(QDialog):
     def update_match_history(self):
         """
         更新历史比赛表格数据
-        从team.match_info中获取基本信息，并通过match_data_manager获取详细比赛数据
+        使用初始化时排好序的比赛信息，并通过match_data_manager获取详细比赛数据
         """
-        # 清空现有数据
-        self.match_table.setRowCount(0)
-
-        # 获取队伍的比赛历史记录
-        match_infos = self.team.get_match_info()
-
-        # 按照日期排序（升序）以便计算积分变化
-        sorted_matches_asc = sorted(match_infos, key=lambda x: x.match_date)
-
-        # 创建一个映射，便于按ID查找上一场比赛的mu值
-        match_id_to_index = {
-            info.match_id: i for i, info in enumerate(sorted_matches_asc)
-        }
-
         # 按照日期降序排列显示
-        sorted_matches_desc = sorted(
-            match_infos, key=lambda x: x.match_date, reverse=True
-        )
-
-        # 填充表格
-        for match_info in sorted_matches_desc:
-            row_position = self.match_table.rowCount()
-            self.match_table.insertRow(row_position)
-
-            # 尝试通过match_data_manager获取详细比赛数据
-            match_data = None
-            if self.match_data_manager:
-                try:
-                    match_data = self.match_data_manager.get_match_by_id(
-                        str(match_info.match_id)
-                    )
-                except Exception as e:
-                    print(f"获取比赛ID {match_info.match_id} 的详细数据时出错: {e}")
-
-            # 填充比赛日期
-            self.match_table.setItem(
-                row_position,
-                0,
-                QTableWidgetItem(match_info.match_date.strftime("%Y-%m-%d")),
+        sorted_matches_desc = self._sorted_matches[::-1]
+        date_strs_desc = self._date_strs[::-1]
+
+        # 通过match_data_manager一次批量获取所有比赛的详细数据
+        match_data_by_id = {}
+        if self.match_data_manager:
+            match_data_by_id = self.match_data_manager.get_matches_by_ids(
+                [match_info.match_id for match_info in sorted_matches_desc]
             )
 
-            # 填充对手信息
+        # 使用共用的TeamNameMapper将对手名称转换为中文
+        get_chinese_name = _mapper().get_chinese_name
+
+        # 收集每行数据，最后一次性交给模型
+        rows = []
+        for match_info, date_str in zip(sorted_matches_desc, date_strs_desc):
+            match_data = match_data_by_id.get(match_info.match_id)
+
+            # 对手信息
             opponent = "未知对手"
             if match_data:
                 # 判断当前队伍是主队还是客队
@@ -455,13 +595,9 @@ class TeamInfoDialog(QDialog):
                     opponent = match_data.get("AwayTeam", "未知对手")
                 else:
                     opponent = match_data.get("HomeTeam", "未知对手")
+                opponent = get_chinese_name(opponent)
 
-                # 使用TeamNameMapper将对手名称转换为中文
-                team_name_mapper = TeamNameMapper()
-                opponent = team_name_mapper.get_chinese_name(opponent)
-            self.match_table.setItem(row_position, 1, QTableWidgetItem(opponent))
-
-            # 填充比分信息
+            # 比分信息
             score = "未知比分"
             if match_data:
                 home_score = match_data.get("FTHG", "-")
@@ -471,29 +607,25 @@ class TeamInfoDialog(QDialog):
                     score = f"{home_score} - {away_score}"
                 else:
                     score = f"{away_score} - {home_score}"
-            self.match_table.setItem(row_position, 2, QTableWidgetItem(score))
 
-            # 填充积分信息（TrueSkill积分，mu*25）
+            # 积分信息（TrueSkill积分，mu*25）
             current_mu = match_info.mu
             scaled_mu = current_mu * 25
-            self.match_table.setItem(
-                row_position, 3, QTableWidgetItem(f"{scaled_mu:.1f}")
-            )
 
-            # 计算并填充积分变化
-            mu_change = 0.0
-            if match_info.match_id in match_id_to_index:
-                current_index = match_id_to_index[match_info.match_id]
-                if current_index > 0:  # 不是第一场比赛
-                    prev_match_info = sorted_matches_asc[current_index - 1]
-                    mu_change = current_mu - prev_match_info.mu
+            # 计算积分变化，第一场比赛没有前一场，变化为0
+            prev_mu = self._prev_mu.get(match_info.match_id)
+            mu_change = current_mu - prev_mu if prev_mu is not None else 0.0
 
             scaled_change = mu_change * 25
-            # 根据变化值设置不同的样式
-            change_item = QTableWidgetItem(f"{scaled_change:+.1f}")
-            if scaled_change > 0:
-                change_item.setForeground(Qt.GlobalColor.green)
-            elif scaled_change < 0:
-                change_item.setForeground(Qt.GlobalColor.red)
+            rows.append(
+                (
+                    date_str,
+                    opponent,
+                    score,
+                    f"{scaled_mu:.1f}",
+                    f"{scaled_change:+.1f}",
+                    scaled_change,
+                )
+            )
 
-            self.match_table.setItem(row_position, 4, change_item)
+        self.match_model.set_rows(rows)
@@ -1,12 +1,9 @@
 import sys
-import os
-
-# 确保当前目录在Python路径中
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import logging
+from operator import attrgetter
 
 from .team import Team
-from league_mapper import get_league_code
-import logging
+from .league_mapper import get_league_code
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +13,21 @@ class TeamManager:
     队伍管理器，负责队伍的创建、存储和管理，确保队伍的唯一性
     """
 
+    __slots__ = ("_teams", "_teams_by_league", "_teams_revision", "_sorted_cache")
+
     def __init__(self):
         """
         初始化队伍管理器
         """
         # 使用字典存储队伍，键为队伍名称，值为Team对象
         self._teams = {}
+        # 联赛索引，键为联赛代码，值为该联赛的{队伍名称: Team对象}，保持队伍创建顺序
+        self._teams_by_league = {}
+        # 队伍集合的版本号，增删队伍时递增
+        self._teams_revision = 0
+        # 排序结果缓存，键为(排序依据, 是否降序)，
+        # 值为(队伍集合版本号, 评级版本号, 排序后的队伍列表)
+        self._sorted_cache = {}
         logger.info("队伍管理器已初始化")
 
     def create_team(self, name, elo=1500.0, mu=25.0, sigma=8.333, league=None):
@@ -40,20 +46,70 @@ class TeamManager:
             bool: 是否是新创建的队伍（True表示新创建，False表示返回已有队伍）
         """
         # 检查队伍是否已存在
-        if name in self._teams:
+        existing = self._teams.get(name)
+        if existing is not None:
             # logger.warning(f"队伍 '{name}' 已存在，返回现有队伍")
             # 如果提供了联赛信息且队伍没有联赛信息，则更新联赛信息
-            if league and not self._teams[name].league:
-                self._teams[name].league = league
-                logger.info(f"更新队伍 '{name}' 的联赛信息为: {league}")
-            return self._teams[name], False
+            if league and not existing.league:
+                existing.league = league
+                self._rebuild_league_index(league)
+                logger.info("更新队伍 '%s' 的联赛信息为: %s", name, league)
+            return existing, False
 
         # 创建新队伍
+        name = sys.intern(name)
         team = Team(name, elo, mu, sigma, league)
         self._teams[name] = team
-        logger.info(f"成功创建新队伍: {name}, 联赛: {league}")
+        self._teams_revision += 1
+        if league:
+            self._teams_by_league.setdefault(league, {})[name] = team
+        logger.info("成功创建新队伍: %s, 联赛: %s", name, league)
         return team, True
 
+    def create_teams_bulk(self, rows, elo=1500.0, mu=25.0, sigma=8.333):
+        """
+        批量创建队伍，已存在的队伍按create_team的方式处理，最后只输出一条汇总日志
+
+        参数:
+            rows (Iterable[tuple]): (队伍名称, 联赛代码)元组序列，可以包含重复的队伍
+            elo (float, optional): 新队伍的初始Elo评分
+            mu (float, optional): 新队伍的初始TrueSkill mu值
+            sigma (float, optional): 新队伍的初始TrueSkill sigma值
+
+        返回:
+            int: 新创建的队伍数量
+        """
+        teams = self._teams
+        teams_by_league = self._teams_by_league
+        created = 0
+        updated_leagues = set()
+        for name, league in rows:
+            team = teams.get(name)
+            if team is not None:
+                # 如果提供了联赛信息且队伍没有联赛信息，则更新联赛信息
+                if league and not team.league:
+                    team.league = league
+                    updated_leagues.add(league)
+                continue
+
+            name = sys.intern(name)
+            team = Team(name, elo, mu, sigma, league)
+            teams[name] = team
+            if league:
+                teams_by_league.setdefault(league, {})[name] = team
+            created += 1
+
+        if created:
+            self._teams_revision += 1
+        for league in updated_leagues:
+            self._rebuild_league_index(league)
+        logger.info(
+            "批量创建新队伍 %d 支，补充联赛信息的联赛: %s",
+            created,
+            sorted(updated_leagues),
+        )
+        return created
+
     def get_team(self, name):
         """
         获取指定名称的队伍
@@ -84,6 +140,24 @@ class TeamManager:
         """
         return list(self._teams.keys())
 
+    def iter_teams(self):
+        """
+        遍历所有队伍，不复制列表，适合只需遍历一次的场景
+
+        返回:
+            ValuesView: 所有Team对象的视图，遍历期间不能增删队伍
+        """
+        return self._teams.values()
+
+    def iter_team_names(self):
+        """
+        遍历所有队伍名称，不复制列表，适合只需遍历一次的场景
+
+        返回:
+            KeysView: 所有队伍名称的视图，遍历期间不能增删队伍
+        """
+        return self._teams.keys()
+
     def update_team_rating(self, name, new_elo=None, new_mu=None, new_sigma=None):
         """
         更新队伍评级
@@ -97,11 +171,15 @@ class TeamManager:
         返回:
             bool: 更新是否成功
         """
-        team = self.get_team(name)
+        team = self._teams.get(name)
         if team:
             team.update_rating(new_elo, new_mu, new_sigma)
             logger.info(
-                f"更新队伍 '{name}' 的评级: Elo={new_elo}, mu={new_mu}, sigma={new_sigma}"
+                "更新队伍 '%s' 的评级: Elo=%s, mu=%s, sigma=%s",
+                name,
+                new_elo,
+                new_mu,
+                new_sigma,
             )
             return True
         logger.warning(f"更新失败，队伍 '{name}' 不存在")
@@ -117,10 +195,10 @@ class TeamManager:
         返回:
             bool: 操作是否成功
         """
-        team = self.get_team(name)
+        team = self._teams.get(name)
         if team:
             team.increment_match_count()
-            # logger.info(f"增加队伍 '{name}' 的比赛次数至 {team.match_count}")
+            # logger.info("增加队伍 '%s' 的比赛次数至 %d", name, team.match_count)
             return True
         logger.warning(f"操作失败，队伍 '{name}' 不存在")
         return False
@@ -136,8 +214,12 @@ class TeamManager:
             bool: 删除是否成功
         """
         if name in self._teams:
-            del self._teams[name]
-            logger.info(f"成功删除队伍: {name}")
+            team = self._teams.pop(name)
+            league_teams = self._teams_by_league.get(team.league)
+            if league_teams is not None:
+                league_teams.pop(name, None)
+            self._teams_revision += 1
+            logger.info("成功删除队伍: %s", name)
             return True
         logger.warning(f"删除失败，队伍 '{name}' 不存在")
         return False
@@ -171,16 +253,30 @@ class TeamManager:
             logger.warning(f"未找到对应的联赛代码: {chinese_league_name}")
             return []
 
-        # 筛选出属于该联赛的队伍
-        league_teams = [
-            team for team in self._teams.values() if team.league == league_code
-        ]
+        # 从联赛索引中取出该联赛的队伍，不再遍历全部队伍筛选
+        league_teams = list(self._teams_by_league.get(league_code, {}).values())
 
         logger.info(
-            f"获取联赛 '{chinese_league_name}' ({league_code}) 的队伍，共 {len(league_teams)} 支"
+            "获取联赛 '%s' (%s) 的队伍，共 %d 支",
+            chinese_league_name,
+            league_code,
+            len(league_teams),
         )
         return league_teams
 
+    def _rebuild_league_index(self, league_code):
+        """
+        按队伍创建顺序重建指定联赛的索引，用于已有队伍补充联赛信息的情况
+
+        参数:
+            league_code (str): 联赛代码
+        """
+        self._teams_by_league[league_code] = {
+            name: team
+            for name, team in self._teams.items()
+            if team.league == league_code
+        }
+
     def get_team_count(self):
         """
         获取队伍总数
@@ -200,9 +296,7 @@ class TeamManager:
         返回:
             list: 排序后的Team对象列表
         """
-        return sorted(
-            self._teams.values(), key=lambda team: team.elo, reverse=descending
-        )
+        return self._get_sorted_teams("elo", attrgetter("elo"), descending)
 
     def get_teams_sorted_by_trueskill(self, descending=True):
         """
@@ -214,17 +308,46 @@ class TeamManager:
         返回:
             list: 排序后的Team对象列表
         """
-        return sorted(
-            self._teams.values(),
-            key=lambda team: team.get_trueskill_rating(),
-            reverse=descending,
+        return self._get_sorted_teams(
+            "trueskill", Team.get_trueskill_rating, descending
+        )
+
+    def _get_sorted_teams(self, sort_by, key, descending):
+        """
+        获取排序后的队伍列表，队伍集合和所有队伍评级都未变化时直接使用缓存的排序结果
+
+        参数:
+            sort_by (str): 排序依据名称，用作缓存键
+            key (callable): 排序键函数
+            descending (bool): 是否降序排列
+
+        返回:
+            list: 排序后的Team对象列表（缓存列表的副本，调用方可以随意修改）
+        """
+        cache_key = (sort_by, descending)
+        cached = self._sorted_cache.get(cache_key)
+        if (
+            cached is not None
+            and cached[0] == self._teams_revision
+            and cached[1] == Team.rating_revision
+        ):
+            return list(cached[2])
+
+        sorted_teams = sorted(self._teams.values(), key=key, reverse=descending)
+        self._sorted_cache[cache_key] = (
+            self._teams_revision,
+            Team.rating_revision,
+            sorted_teams,
         )
+        return list(sorted_teams)
 
     def clear_all_teams(self):
         """
         清除所有队伍
         """
         self._teams.clear()
+        self._teams_by_league.clear()
+        self._teams_revision += 1
         logger.info("已清除所有队伍")
 
     def __str__(self):
@@ -0,0 +1,28 @@
+import pytest
+
+from src.match_data import MatchDataManager
+from src.sqlite_importer import SQLiteImporter
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """
+    在临时目录中创建带有matches表的空数据库，返回数据库文件路径
+    """
+    path = str(tmp_path / "match_data.db")
+    # SQLiteImporter是单例，测试前后都重置，避免复用其他数据库的连接
+    SQLiteImporter._instance = None
+    importer = SQLiteImporter(path)
+    importer.close()
+    SQLiteImporter._instance = None
+    return path
+
+
+@pytest.fixture
+def manager(db_path):
+    """
+    连接到临时数据库的MatchDataManager，测试结束后关闭连接
+    """
+    manager = MatchDataManager(db_path)
+    yield manager
+    manager.close()
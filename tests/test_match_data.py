@@ -0,0 +1,72 @@
+import sqlite3
+import threading
+
+import pytest
+
+from src import match_data
+
+
+def _match(home, away, date=1):
+    return {"Div": "E0", "Date": date, "HomeTeam": home, "AwayTeam": away}
+
+
+@pytest.mark.parametrize("supports_returning", [True, False])
+def test_save_matches_keeps_ids_when_duplicates_ignored(
+    manager, monkeypatch, supports_returning
+):
+    """重复记录被唯一约束忽略时，同批中其他记录的ID仍然按输入顺序返回"""
+    monkeypatch.setattr(match_data, "_SUPPORTS_RETURNING", supports_returning)
+    matches = [
+        _match("A", "B"),
+        _match("A", "C"),
+        _match("A", "B"),
+        {**_match("B", "C"), "FTR": "H"},
+    ]
+
+    ids = manager.save_matches(matches)
+
+    assert len(ids) == 3
+    saved = manager.get_matches_by_ids(ids)
+    teams = [(saved[int(i)]["HomeTeam"], saved[int(i)]["AwayTeam"]) for i in ids]
+    assert teams == [("A", "B"), ("A", "C"), ("B", "C")]
+
+
+def test_save_matches_all_duplicates(manager):
+    """整批都是已存在的记录时不返回任何ID，也不影响之后的插入"""
+    assert len(manager.save_matches([_match("A", "B"), _match("A", "C")])) == 2
+    assert manager.save_matches([_match("A", "B"), _match("A", "C")]) == []
+    assert len(manager.save_matches([_match("A", "B", 2)])) == 1
+
+
+def test_thread_connection_closed_when_thread_ends(manager):
+    """工作线程结束后，其连接从共享记录中移除并被关闭"""
+    opened = []
+
+    def worker():
+        manager.get_matches(limit=1)
+        opened.append(manager.conn)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    conn = opened[0]
+    assert conn is not manager.conn
+    assert conn not in manager._shared.connections
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    # 当前线程的连接不受影响
+    assert manager.conn in manager._shared.connections
+    manager.conn.execute("SELECT 1")
+
+
+def test_batches_follow_connection_variable_limit(manager):
+    """批量插入和按ID查询按连接实际的参数数量上限分批（如旧版SQLite的999）"""
+    manager.conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 10)
+    matches = [_match(f"H{i}", f"A{i}") for i in range(30)]
+
+    ids = manager.save_matches(matches)
+    saved = manager.get_matches_by_ids(ids)
+
+    assert len(ids) == 30
+    assert [saved[int(i)]["HomeTeam"] for i in ids] == [f"H{i}" for i in range(30)]
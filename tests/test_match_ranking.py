@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from src import match_ranking
+from src.match_ranking import EloAlgorithm
+
+
+def _random_matches(count, team_count=20, seed=0):
+    rng = random.Random(seed)
+    teams = [f"Team {i}" for i in range(team_count)]
+    matches = []
+    for _ in range(count):
+        home, away = rng.sample(teams, 2)
+        matches.append((home, away, rng.randint(0, 4), rng.randint(0, 4)))
+    return matches
+
+
+@pytest.mark.parametrize(
+    "compiled",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                match_ranking._run_elo_compiled is None, reason="未安装numba"
+            ),
+        ),
+    ],
+)
+def test_process_matches_equals_process_match(monkeypatch, compiled):
+    """批量处理与逐场调用process_match得到完全相同的评分和队伍顺序"""
+    if not compiled:
+        monkeypatch.setattr(match_ranking, "_run_elo_compiled", None)
+    warmup = _random_matches(50, seed=1)
+    matches = _random_matches(2000)
+
+    expected = EloAlgorithm()
+    for match in warmup + matches:
+        expected.process_match(*match)
+
+    # 批量处理前已有部分队伍的评分
+    actual = EloAlgorithm()
+    for match in warmup:
+        actual.process_match(*match)
+    actual.process_matches(*zip(*matches))
+
+    assert list(actual.teams.items()) == list(expected.teams.items())
+    assert actual.get_rankings() == expected.get_rankings()
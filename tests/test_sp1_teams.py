@@ -1,9 +1,5 @@
-import sys
-import os
-from collections import defaultdict
-
-# 添加项目根目录到Python路径，确保能够导入src模块
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from collections import Counter
+from itertools import chain, islice
 
 from src.match_data import MatchDataManager
 
@@ -15,27 +11,23 @@ def test_sp1_teams_count():
     """
     print("\n开始测试: 查询西甲(SP1)比赛数据并统计参赛队伍信息")
 
-    # 创建MatchDataManager实例，连接到hao_football数据库
-    # 根据之前的分析，用户提到实际数据库名称为hao_football
-    match_data_manager = MatchDataManager(
-        db_name="hao_football", collection_name="matches"
-    )
+    # 创建MatchDataManager实例，连接到项目根目录下的SQLite数据库
+    match_data_manager = MatchDataManager()
 
-    # 查询Div字段值为SP1的所有比赛数据
+    # 逐条读取Div字段值为SP1的比赛数据，只取统计和示例输出用到的字段，
+    # 不把全部结果一次性载入内存
     print("\n查询Div字段值为SP1的所有比赛数据...")
-    sp1_matches = match_data_manager.get_matches(filters={"Div": "SP1"}, limit=None)
-
-    # 验证查询结果
-    print(f"\n成功查询到{len(sp1_matches)}场西甲比赛")
-    assert len(sp1_matches) >= 0, "查询结果数量应为非负数"
+    sp1_matches = match_data_manager.get_matches_iter(
+        filters={"Div": "SP1"},
+        limit=None,
+        projection=["HomeTeam", "AwayTeam", "Date"],
+    )
 
-    # 如果没有查询到数据，可能使用的是模拟数据
-    if not sp1_matches:
-        print("警告: 未查询到实际西甲比赛数据，将使用模拟数据进行统计")
-    else:
-        # 显示前3条数据作为示例
+    # 先取出前3条数据作为示例，其余数据在统计时继续读取
+    sample_matches = list(islice(sp1_matches, 3))
+    if sample_matches:
         print("\n查询结果示例 (前3条):")
-        for i, match in enumerate(sp1_matches[:3]):
+        for i, match in enumerate(sample_matches):
             home_team = match.get("HomeTeam", "未知")
             away_team = match.get("AwayTeam", "未知")
             date = match.get("Date", "未知")
@@ -43,17 +35,26 @@ def test_sp1_teams_count():
 
     # 统计每个队伍的参赛次数
     print("\n统计各队伍参赛次数...")
-    team_counts = defaultdict(int)
+    # 将每场比赛的主客队展开为一个序列，由Counter一次完成计数
+    team_counts = Counter(
+        chain.from_iterable(
+            (match.get("HomeTeam", "未知"), match.get("AwayTeam", "未知"))
+            for match in chain(sample_matches, sp1_matches)
+        )
+    )
+    # 每场比赛恰好为主客两队各计一次
+    match_count = team_counts.total() // 2
+
+    # 验证查询结果
+    print(f"\n成功查询到{match_count}场西甲比赛")
+    assert match_count >= 0, "查询结果数量应为非负数"
 
-    # 遍历所有比赛，统计每个队伍的参赛次数
-    for match in sp1_matches:
-        home_team = match.get("HomeTeam", "未知")
-        away_team = match.get("AwayTeam", "未知")
-        team_counts[home_team] += 1
-        team_counts[away_team] += 1
+    # 如果没有查询到数据，可能使用的是模拟数据
+    if not match_count:
+        print("警告: 未查询到实际西甲比赛数据，将使用模拟数据进行统计")
 
-    # 将结果转换为列表并按参赛次数降序排序
-    sorted_teams = sorted(team_counts.items(), key=lambda x: x[1], reverse=True)
+    # 按参赛次数降序排列，次数相同时保持首次出现的顺序
+    sorted_teams = team_counts.most_common()
 
     # 清晰输出所有参赛队伍的名称及其对应的参赛次数信息
     print("\n西甲联赛(SP1)参赛队伍及参赛次数统计:")
@@ -65,17 +66,17 @@ def test_sp1_teams_count():
         print(f"{team:<30}{count:<15}{rank:<10}")
 
     print("-" * 60)
-    print(f"总计: {len(sorted_teams)}支队伍参与了{len(sp1_matches)}场比赛")
+    print(f"总计: {len(sorted_teams)}支队伍参与了{match_count}场比赛")
 
     # 如果有数据，确保至少有队伍被统计到
-    if sp1_matches:
+    if match_count:
         assert len(sorted_teams) > 0, "至少应该有一支队伍被统计到"
 
     print("\n测试完成: 西甲(SP1)比赛数据查询和队伍统计成功")
     # 移除返回值，避免pytest警告
 
 
-# 添加主函数支持直接运行
+# 添加主函数支持直接运行，在项目根目录执行: python -m tests.test_sp1_teams
 if __name__ == "__main__":
     test_sp1_teams_count()
     print("\n所有测试完成")
@@ -0,0 +1,109 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from src.sqlite_importer import SQLiteImporter, _parse_date, _parse_date_fallback
+
+
+@pytest.fixture
+def importer(db_path):
+    """连接到临时数据库的SQLiteImporter，测试结束后关闭并重置单例"""
+    SQLiteImporter._instance = None
+    importer = SQLiteImporter(db_path)
+    yield importer
+    importer.close()
+    SQLiteImporter._instance = None
+
+
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        # 四位年份，只有日期时补充18:00
+        ("12/08/2017", datetime(2017, 8, 12, 18, 0)),
+        # 两位年份与strptime的%y一致：00-68为20xx，69-99为19xx
+        ("14/08/10", datetime(2010, 8, 14, 18, 0)),
+        ("14/08/68", datetime(2068, 8, 14, 18, 0)),
+        ("14/08/69", datetime(1969, 8, 14, 18, 0)),
+        # 逗号或空格分隔的时间
+        ("21/08/2020,18:00", datetime(2020, 8, 21, 18, 0)),
+        ("21/08/2020 12:30", datetime(2020, 8, 21, 12, 30)),
+        ("14/08/10,15:45", datetime(2010, 8, 14, 15, 45)),
+        ("14/08/10 09:05", datetime(2010, 8, 14, 9, 5)),
+        # 没有补零的日、月、时由原有的strptime逻辑处理
+        ("1/08/2017", datetime(2017, 8, 1, 18, 0)),
+        ("5/9/2020 7:05", datetime(2020, 9, 5, 7, 5)),
+        ("5/9/2020,7:05", datetime(2020, 9, 5, 7, 5)),
+    ],
+)
+def test_parse_date(date_str, expected):
+    """正则快速路径与原有的逐一尝试格式的解析结果一致"""
+    assert _parse_date(date_str) == int(expected.timestamp())
+    assert _parse_date_fallback(date_str) == int(expected.timestamp())
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "31/02/2020",
+        "30/02/20",
+        "31/04/2020,18:00",
+        "12/13/2017",
+        # 8个字符的字符串按两位年份解析，原有逻辑也无法识别
+        "1/8/2017",
+        "abc",
+    ],
+)
+def test_parse_date_invalid(date_str):
+    """不存在的日期和无法识别的写法返回None"""
+    assert _parse_date(date_str) is None
+    assert _parse_date_fallback(date_str) is None
+
+
+def test_import_csv_counts(importer, db_path, tmp_path):
+    """重复行计入跳过数，空行不计数，缺少字段的短行补空值后导入"""
+    csv_path = tmp_path / "E0.csv"
+    csv_path.write_text(
+        "Div,Date,HomeTeam,AwayTeam,FTHG,FTAG\n"
+        "E0,12/08/2017,Arsenal,Leicester,4,3\n"
+        "E0,12/08/2017,Arsenal,Leicester,4,3\n"
+        "\n"
+        "E0,13/08/2017,Chelsea\n",
+        encoding="utf-8",
+    )
+
+    result = importer.import_csv(str(csv_path))
+
+    assert result["success"]
+    assert result["total_rows"] == 3
+    assert result["imported_rows"] == 2
+    assert result["skipped_rows"] == 1
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT Date, HomeTeam, AwayTeam, FTHG FROM matches ORDER BY Date"
+        ).fetchall()
+    assert rows == [
+        (int(datetime(2017, 8, 12, 18, 0).timestamp()), "Arsenal", "Leicester", "4"),
+        (int(datetime(2017, 8, 13, 18, 0).timestamp()), "Chelsea", None, None),
+    ]
+
+
+def test_import_csv_with_low_variable_limit(importer, db_path, tmp_path):
+    """连接参数上限为999（SQLite 3.32之前的默认值）时按上限拆分多行INSERT"""
+    importer.conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    lines = ["Div,Date,HomeTeam,AwayTeam,FTHG,FTAG"]
+    lines += [f"E0,12/08/2017,Home{i},Away{i},1,0" for i in range(150)]
+    # 重复前10行
+    lines += lines[1:11]
+    csv_path = tmp_path / "E0.csv"
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    result = importer.import_csv(str(csv_path))
+
+    assert result["success"], result.get("error")
+    assert result["total_rows"] == 160
+    assert result["imported_rows"] == 150
+    assert result["skipped_rows"] == 10
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0] == 150
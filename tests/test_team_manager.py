@@ -0,0 +1,89 @@
+from src.team_manager import TeamManager
+
+
+def _names(teams):
+    return [team.name for team in teams]
+
+
+def test_sorted_teams_follow_rating_and_team_changes():
+    """排序缓存在评级变化、增删队伍后失效，返回的列表可以随意修改"""
+    manager = TeamManager()
+    manager.create_team("A", elo=1500)
+    manager.create_team("B", elo=1600)
+    manager.create_team("C", elo=1400)
+
+    first = manager.get_teams_sorted_by_elo()
+    assert _names(first) == ["B", "A", "C"]
+    first.clear()
+    assert _names(manager.get_teams_sorted_by_elo()) == ["B", "A", "C"]
+    assert _names(manager.get_teams_sorted_by_elo(descending=False)) == ["C", "A", "B"]
+
+    manager.update_team_rating("C", new_elo=1700)
+    assert _names(manager.get_teams_sorted_by_elo()) == ["C", "B", "A"]
+
+    # 直接修改属性同样使缓存失效
+    manager.get_team("A").elo = 1800
+    assert _names(manager.get_teams_sorted_by_elo()) == ["A", "C", "B"]
+
+    manager.create_team("D", elo=1650)
+    assert _names(manager.get_teams_sorted_by_elo()) == ["A", "C", "D", "B"]
+    manager.delete_team("C")
+    assert _names(manager.get_teams_sorted_by_elo()) == ["A", "D", "B"]
+
+
+def test_sorted_teams_by_trueskill():
+    """TrueSkill排序使用2*mu - 3*sigma，mu或sigma变化后重新排序"""
+    manager = TeamManager()
+    manager.create_team("A", mu=25.0, sigma=8.0)
+    manager.create_team("B", mu=30.0, sigma=8.0)
+    assert _names(manager.get_teams_sorted_by_trueskill()) == ["B", "A"]
+
+    manager.get_team("B").sigma = 12.0
+    assert _names(manager.get_teams_sorted_by_trueskill()) == ["A", "B"]
+
+
+def test_league_index():
+    """联赛索引按队伍创建顺序返回，随补充联赛信息和删除队伍更新"""
+    manager = TeamManager()
+    manager.create_team("Arsenal", league="E0")
+    manager.create_team("Barcelona", league="SP1")
+    manager.create_team("Chelsea")
+    manager.create_team("Everton", league="E0")
+
+    assert _names(manager.get_teams_by_league("英超")) == ["Arsenal", "Everton"]
+    assert _names(manager.get_teams_by_league("西甲")) == ["Barcelona"]
+    assert manager.get_teams_by_league("未知联赛") == []
+
+    # 已有队伍补充联赛信息后，仍按创建顺序排在中间
+    manager.create_team("Chelsea", league="E0")
+    assert _names(manager.get_teams_by_league("英超")) == [
+        "Arsenal",
+        "Chelsea",
+        "Everton",
+    ]
+
+    manager.delete_team("Arsenal")
+    assert _names(manager.get_teams_by_league("英超")) == ["Chelsea", "Everton"]
+
+
+def test_create_teams_bulk_matches_create_team():
+    """批量创建与逐个调用create_team得到相同的队伍和联赛索引"""
+    rows = [
+        ("Arsenal", "E0"),
+        ("Chelsea", None),
+        ("Barcelona", "SP1"),
+        ("Arsenal", "E0"),
+        ("Chelsea", "E0"),
+    ]
+    expected = TeamManager()
+    for name, league in rows:
+        expected.create_team(name, league=league)
+
+    actual = TeamManager()
+    assert actual.create_teams_bulk(rows) == 3
+
+    assert actual.get_team_names() == expected.get_team_names()
+    for league in ("英超", "西甲"):
+        assert _names(actual.get_teams_by_league(league)) == _names(
+            expected.get_teams_by_league(league)
+        )